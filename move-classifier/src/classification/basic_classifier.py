@@ -16,6 +16,7 @@ from pathlib import Path
 from ..models.enums import Classification
 from ..models.extracted_nodes import ExtractedPreviousNode, ExtractedCurrentNode
 from ..models.state_tree import StateTreeNode
+from ..utils.json_utils import json_loads
 
 
 class OpeningBook:
@@ -43,8 +44,8 @@ class OpeningBook:
     def _load_openings(self, file_path: Path) -> None:
         """Load openings from JSON file."""
         try:
-            with open(file_path, 'r') as f:
-                self._openings = json.load(f)
+            with open(file_path, 'rb') as f:
+                self._openings = json_loads(f.read())
         except FileNotFoundError:
             raise FileNotFoundError(f"Opening book not found: {file_path}")
         except json.JSONDecodeError as e:
@@ -60,9 +61,8 @@ class OpeningBook:
         Returns:
             Opening name if found, None otherwise
         """
-        # Extract piece placement (before first space)
-        piece_placement = fen.split(" ")[0]
-        return self._openings.get(piece_placement)
+        # Look up by piece placement (before first space)
+        return self._openings.get(fen.partition(" ")[0])
     
     @property
     def size(self) -> int:
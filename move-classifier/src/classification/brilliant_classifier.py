@@ -45,8 +45,9 @@ def consider_brilliant_classification(
     if current.played_move and current.played_move.promotion:
         return False
     
-    # Get the player's color (who made the move)
-    player_color = chess.Board(previous.state.fen).turn
+    # Get the player's color (who made the move) from the board already
+    # parsed for the previous position
+    player_color = previous.board.turn
     
     # Get unsafe pieces BEFORE the move
     previous_unsafe_pieces = get_unsafe_pieces(
@@ -57,9 +58,9 @@ def consider_brilliant_classification(
     # Determine what was captured (from previous board, before the move)
     captured_piece_value = 0
     if current.played_move:
-        captured_piece = previous.board.piece_at(current.played_move.to_square)
-        if captured_piece:
-            captured_piece_value = PIECE_VALUES[captured_piece.piece_type]
+        captured_piece_type = previous.board.piece_type_at(current.played_move.to_square)
+        if captured_piece_type:
+            captured_piece_value = PIECE_VALUES[captured_piece_type]
     
     # Get unsafe pieces AFTER the move
     # We need to manually filter based on captured piece value
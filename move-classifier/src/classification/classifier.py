@@ -23,6 +23,10 @@ from ..classification.brilliant_classifier import consider_brilliant_classificat
 from ..classification.missed_opportunity_classifier import consider_missed_opportunity_classification
 
 
+# Ordering value a move must reach to be considered for BRILLIANT
+_BEST_VALUE = CLASSIFICATION_VALUES[Classification.BEST]
+
+
 class Classifier:
     """
     Main classification engine that orchestrates the classification process.
@@ -70,9 +74,12 @@ class Classifier:
         if not node.parent:
             raise ValueError("no parent node exists to compare with.")
         
-        # Extract both previous and current nodes
+        # Extract both previous and current nodes, sharing the parent board
         previous = extract_previous_state_tree_node(node.parent)
-        current = extract_current_state_tree_node(node)
+        current = extract_current_state_tree_node(
+            node,
+            previous.board if previous else None
+        )
         
         if not previous or not current:
             raise ValueError("information missing from current or previous node.")
@@ -106,7 +113,7 @@ class Classifier:
             return result
         
         # Check if top move was played
-        top_move_played = previous.top_move.uci() == current.played_move.uci()
+        top_move_played = previous.top_move == current.played_move
         
         # Point loss classification
         classification = (
@@ -126,7 +133,7 @@ class Classifier:
         # Consider BRILLIANT classification (only if classification is BEST or better)
         if (
             opts.include_brilliant
-            and CLASSIFICATION_VALUES.get(classification, 0) >= CLASSIFICATION_VALUES[Classification.BEST]
+            and CLASSIFICATION_VALUES.get(classification, 0) >= _BEST_VALUE
             and consider_brilliant_classification(previous, current)
         ):
             classification = Classification.BRILLIANT
@@ -56,12 +56,13 @@ def consider_critical_classification(
         )
         
         # Check if it's a capture
-        captured_piece = previous.board.piece_at(get_capture_square(move))
+        capture_square = get_capture_square(move)
+        captured_piece = previous.board.piece_at(capture_square)
         if captured_piece:
             # Check if the captured piece was safe (not free material)
             captured_piece_obj = BoardPiece(
                 color=captured_piece.color,
-                square=get_capture_square(move),
+                square=capture_square,
                 type=captured_piece.piece_type
             )
             
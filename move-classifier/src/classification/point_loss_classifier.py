@@ -5,15 +5,68 @@ Classifies moves based on evaluation drop (point loss) or mate transitions.
 Matches JavaScript implementation from classification/pointLoss.ts
 """
 
+from bisect import bisect_right
+from typing import Sequence
+
 import chess
 from ..models.enums import Classification, PieceColor
 from ..models.extracted_nodes import ExtractedPreviousNode, ExtractedCurrentNode
 from ..utils.evaluation_utils import get_expected_points_loss
 
 
+# Module-level aliases, so the per-move paths below load a single global
+# instead of going through the Enum class attribute lookup
+_BEST = Classification.BEST
+_MISTAKE = Classification.MISTAKE
+_BLUNDER = Classification.BLUNDER
+_WHITE = PieceColor.WHITE
+_BLACK = PieceColor.BLACK
+
+# Threshold tables, searched with bisect_right: a value lands in the
+# classification at the index of the first threshold greater than it.
+
+# Mate loss (mover's perspective) once a mate was kept
+MATE_LOSS_THRESHOLDS = (2, 7)
+MATE_LOSS_CLASSIFICATIONS = (
+    Classification.EXCELLENT,
+    Classification.GOOD,
+    Classification.INACCURACY,
+)
+
+# Centipawns left (mover's perspective) after losing a mate
+MATE_TO_CP_THRESHOLDS = (0, 200, 400, 800)
+MATE_TO_CP_CLASSIFICATIONS = (
+    Classification.BLUNDER,
+    Classification.MISTAKE,
+    Classification.INACCURACY,
+    Classification.GOOD,
+    Classification.EXCELLENT,
+)
+
+# Mate distance (mover's perspective) after allowing a mate
+CP_TO_MATE_THRESHOLDS = (-5, -2)
+CP_TO_MATE_CLASSIFICATIONS = (
+    Classification.INACCURACY,
+    Classification.MISTAKE,
+    Classification.BLUNDER,
+)
+
+# Expected points lost between two centipawn evaluations
+POINT_LOSS_THRESHOLDS = (0.01, 0.045, 0.08, 0.12, 0.22)
+POINT_LOSS_CLASSIFICATIONS = (
+    Classification.BEST,
+    Classification.EXCELLENT,
+    Classification.GOOD,
+    Classification.INACCURACY,
+    Classification.MISTAKE,
+    Classification.BLUNDER,
+)
+
+
 def point_loss_classify(
     previous: ExtractedPreviousNode,
-    current: ExtractedCurrentNode
+    current: ExtractedCurrentNode,
+    thresholds: Sequence[float] = POINT_LOSS_THRESHOLDS
 ) -> Classification:
     """
     Classify move using two evaluations and point loss calculation.
@@ -23,98 +76,132 @@ def point_loss_classify(
     Args:
         previous: Position before the move
         current: Position after the move
+        thresholds: Ascending point loss upper bounds for BEST, EXCELLENT,
+                    GOOD, INACCURACY and MISTAKE (default: JavaScript values)
         
     Returns:
         Classification based on point loss or mate transitions
     """
     # Determine move color (whose turn it was in previous position)
     move_color_is_white = previous.board.turn == chess.WHITE
+    color_sign = 1 if move_color_is_white else -1
     
-    # Calculate previous subjective value (from mover's perspective)
-    previousSubjectiveValue = previous.evaluation.value * (
-        1 if move_color_is_white else -1
-    )
+    previous_type = previous.evaluation.type
+    current_type = current.evaluation.type
     
     # Get current subjective evaluation value
-    subjectiveValue = current.subjective_evaluation.value
-    
-    # Case 1: Mate to mate evaluations
-    if (
-        previous.evaluation.type == "mate"
-        and current.evaluation.type == "mate"
-    ):
-        # Winning mate to losing mate
-        if previousSubjectiveValue > 0 and subjectiveValue < 0:
-            return (
-                Classification.MISTAKE if subjectiveValue < -3
-                else Classification.BLUNDER
+    subjective_value = current.subjective_evaluation.value
+    
+    if previous_type == "mate":
+        # Case 1: Mate to mate evaluations
+        if current_type == "mate":
+            return _classify_mate_to_mate(
+                previous.evaluation.value,
+                current.evaluation.value,
+                subjective_value,
+                color_sign
             )
         
-        # For the losing side, making a move that keeps the mate the same
-        # is best. Only the winning side expects a mate loss of -1.
-        mateLoss = (
-            (current.evaluation.value - previous.evaluation.value)
-            * (1 if move_color_is_white else -1)
-        )
-        
-        if mateLoss < 0 or (mateLoss == 0 and subjectiveValue < 0):
-            return Classification.BEST
-        elif mateLoss < 2:
-            return Classification.EXCELLENT
-        elif mateLoss < 7:
-            return Classification.GOOD
-        else:
-            return Classification.INACCURACY
-    
-    # Case 2: Mate to centipawn evaluations
-    if (
-        previous.evaluation.type == "mate"
-        and current.evaluation.type == "centipawn"
-    ):
-        if subjectiveValue >= 800:
-            return Classification.EXCELLENT
-        elif subjectiveValue >= 400:
-            return Classification.GOOD
-        elif subjectiveValue >= 200:
-            return Classification.INACCURACY
-        elif subjectiveValue >= 0:
-            return Classification.MISTAKE
-        else:
-            return Classification.BLUNDER
+        # Case 2: Mate to centipawn evaluations
+        return _classify_mate_to_cp(subjective_value)
     
     # Case 3: Centipawn to mate evaluations
-    if (
-        previous.evaluation.type == "centipawn"
-        and current.evaluation.type == "mate"
-    ):
-        if subjectiveValue > 0:
-            return Classification.BEST
-        elif subjectiveValue >= -2:
-            return Classification.BLUNDER
-        elif subjectiveValue >= -5:
-            return Classification.MISTAKE
-        else:
-            return Classification.INACCURACY
+    if current_type == "mate":
+        return _classify_cp_to_mate(subjective_value)
     
     # Case 4: Centipawn to centipawn evaluations
     # Convert chess.WHITE/BLACK to PieceColor enum
-    move_color = PieceColor.WHITE if move_color_is_white else PieceColor.BLACK
+    move_color = _WHITE if move_color_is_white else _BLACK
     
-    pointLoss = get_expected_points_loss(
+    point_loss = get_expected_points_loss(
         previous.evaluation,
         current.evaluation,
         move_color
     )
     
-    if pointLoss < 0.01:
-        return Classification.BEST
-    elif pointLoss < 0.045:
-        return Classification.EXCELLENT
-    elif pointLoss < 0.08:
-        return Classification.GOOD
-    elif pointLoss < 0.12:
-        return Classification.INACCURACY
-    elif pointLoss < 0.22:
-        return Classification.MISTAKE
-    else:
-        return Classification.BLUNDER
+    return _classify_cp_to_cp(point_loss, thresholds)
+
+
+def _classify_mate_to_mate(
+    previous_value: float,
+    current_value: float,
+    subjective_value: float,
+    color_sign: int
+) -> Classification:
+    """
+    Classify a transition between two mate evaluations.
+    
+    Args:
+        previous_value: Mate distance before the move (White's perspective)
+        current_value: Mate distance after the move (White's perspective)
+        subjective_value: Mate distance after the move (mover's perspective)
+        color_sign: 1 if White moved, -1 if Black moved
+        
+    Returns:
+        Classification for the mate transition
+    """
+    # Calculate previous subjective value (from mover's perspective)
+    previous_subjective_value = previous_value * color_sign
+    
+    # Winning mate to losing mate
+    if previous_subjective_value > 0 and subjective_value < 0:
+        return (
+            _MISTAKE if subjective_value < -3
+            else _BLUNDER
+        )
+    
+    # For the losing side, making a move that keeps the mate the same
+    # is best. Only the winning side expects a mate loss of -1.
+    mate_loss = (current_value - previous_value) * color_sign
+    
+    if mate_loss < 0 or (mate_loss == 0 and subjective_value < 0):
+        return _BEST
+    
+    return MATE_LOSS_CLASSIFICATIONS[bisect_right(MATE_LOSS_THRESHOLDS, mate_loss)]
+
+
+def _classify_mate_to_cp(subjective_value: float) -> Classification:
+    """
+    Classify a move that turned a mate evaluation into a centipawn one.
+    
+    Args:
+        subjective_value: Centipawn evaluation after the move (mover's perspective)
+        
+    Returns:
+        Classification for the lost mate
+    """
+    return MATE_TO_CP_CLASSIFICATIONS[bisect_right(MATE_TO_CP_THRESHOLDS, subjective_value)]
+
+
+def _classify_cp_to_mate(subjective_value: float) -> Classification:
+    """
+    Classify a move that turned a centipawn evaluation into a mate one.
+    
+    Args:
+        subjective_value: Mate distance after the move (mover's perspective)
+        
+    Returns:
+        Classification for the new mate
+    """
+    if subjective_value > 0:
+        return _BEST
+    
+    return CP_TO_MATE_CLASSIFICATIONS[bisect_right(CP_TO_MATE_THRESHOLDS, subjective_value)]
+
+
+def _classify_cp_to_cp(
+    point_loss: float,
+    thresholds: Sequence[float] = POINT_LOSS_THRESHOLDS
+) -> Classification:
+    """
+    Classify a move between two centipawn evaluations by its point loss.
+    
+    Args:
+        point_loss: Expected points lost by the move
+        thresholds: Ascending point loss upper bounds, one per
+                    classification except BLUNDER
+        
+    Returns:
+        Classification for the point loss
+    """
+    return POINT_LOSS_CLASSIFICATIONS[bisect_right(thresholds, point_loss)]
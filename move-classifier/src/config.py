@@ -7,8 +7,10 @@ Configurable parameters for the classification system.
 from typing import Optional
 from dataclasses import dataclass
 
+from .constants import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class EngineConfig:
     """Configuration for engine analysis."""
     
@@ -24,8 +26,17 @@ class EngineConfig:
     use_cloud_eval: bool = True
     """Try cloud evaluation before local engine."""
     
+    cloud_cache_path: Optional[str] = None
+    """On-disk cache of cloud evaluation responses shared between runs (None = off)."""
+    
     stockfish_path: Optional[str] = None
     """Path to Stockfish binary. If None, will search in PATH."""
+    
+    engine_workers: int = 1
+    """Number of local engines analyzing positions in parallel (1 = sequential)."""
+    
+    engine_cache_path: Optional[str] = None
+    """On-disk cache of local engine results shared between runs (None = off)."""
 
 
 @dataclass
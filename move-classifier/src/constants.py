@@ -4,11 +4,26 @@ System Constants
 Critical constants used throughout the classification system.
 """
 
+import math
+import sys
+
 import chess
 
+# Keyword arguments for @dataclass on the small, frequently created models.
+# slots=True drops the per-instance __dict__ but needs Python 3.10+
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 # Expected Points Calculation
 CENTIPAWN_GRADIENT = 0.0035
 
+# Precomputed expected points for integer centipawn evaluations at the
+# default gradient, indexed by (centipawns + EXPECTED_POINTS_LUT_BOUND)
+EXPECTED_POINTS_LUT_BOUND = 2000
+EXPECTED_POINTS_LUT = tuple(
+    1.0 / (1.0 + math.exp(-CENTIPAWN_GRADIENT * centipawns))
+    for centipawns in range(-EXPECTED_POINTS_LUT_BOUND, EXPECTED_POINTS_LUT_BOUND + 1)
+)
+
 # Move Accuracy Calculation
 ACCURACY_MULTIPLIER = 103.16
 ACCURACY_EXPONENT = -4.0
@@ -5,20 +5,66 @@ Provides position evaluation using Lichess cloud analysis API.
 Handles response parsing and castling notation conversion.
 """
 
-from typing import List, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence, Tuple, Union
+import sqlite3
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
 import chess
 
 from ..models.state_tree import EngineLine, Evaluation, Move
 from ..models.enums import EngineVersion
+from ..utils.json_utils import json_loads
 from ..utils.notation_converter import normalize_lichess_castling
-from ..utils.chess_utils import is_black_to_move
+from .disk_cache import open_cache
+
+
+# Table of the on-disk cache of raw cloud evaluation responses
+_CACHE_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS evals ("
+    "fen TEXT, multi_pv INTEGER, depth INTEGER, payload BLOB, "
+    "PRIMARY KEY (fen, multi_pv))"
+)
+
+CLOUD_BATCH_CONCURRENCY = 8
+"""Maximum number of cloud evaluation requests in flight at once."""
+
+CLOUD_MAX_RETRIES = 3
+"""Retries for a rate limited (HTTP 429) request before giving up."""
+
+CLOUD_MAX_RETRY_DELAY = 30.0
+"""Longest wait in seconds before retrying a rate limited request."""
+
+CLOUD_CACHE_SIZE = 4096
+"""Maximum number of cloud evaluations kept in memory."""
+
+# Parsed cloud evaluations by (fen, multi_pv, cache_path). Lines are stored
+# as tuples, so callers cannot change what later callers get
+_cloud_lines: "OrderedDict[Tuple[str, int, Optional[str]], Tuple[EngineLine, ...]]" = (
+    OrderedDict()
+)
+_cloud_lines_lock = threading.Lock()
+
+# Shared session, so consecutive requests reuse pooled keep-alive connections
+# instead of opening a new TCP and TLS connection each time
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=CLOUD_BATCH_CONCURRENCY * 2,
+        pool_maxsize=CLOUD_BATCH_CONCURRENCY * 2
+    )
+)
 
 
 def get_cloud_evaluation(
     fen: str,
     multi_pv: int = 2,
-    timeout: int = 10
+    timeout: int = 10,
+    cache_path: Optional[str] = None
 ) -> List[EngineLine]:
     """
     Get position evaluation from Lichess cloud API.
@@ -27,6 +73,8 @@ def get_cloud_evaluation(
         fen: Position in FEN notation
         multi_pv: Number of principal variations to request
         timeout: Request timeout in seconds
+        cache_path: On-disk cache of responses shared between runs
+                    (if None, responses are only cached in memory)
         
     Returns:
         List of engine lines from cloud evaluation
@@ -34,20 +82,231 @@ def get_cloud_evaluation(
     Raises:
         Exception: If cloud evaluation fails
     """
+    cache_key = (fen, multi_pv, cache_path)
+    with _cloud_lines_lock:
+        cached_lines = _cloud_lines.get(cache_key)
+        if cached_lines is not None:
+            _cloud_lines.move_to_end(cache_key)
+            return list(cached_lines)
+    
+    data = _get_cloud_payload(fen, multi_pv, timeout, cache_path)
+    
+    # Parse response
+    engine_lines = _parse_lichess_response(fen, data)
+    
+    with _cloud_lines_lock:
+        _cloud_lines[cache_key] = tuple(engine_lines)
+        _cloud_lines.move_to_end(cache_key)
+        if len(_cloud_lines) > CLOUD_CACHE_SIZE:
+            _cloud_lines.popitem(last=False)
+    
+    return engine_lines
+
+
+def clear_cloud_cache() -> None:
+    """Forget the cloud evaluations kept in memory."""
+    with _cloud_lines_lock:
+        _cloud_lines.clear()
+
+
+def get_cloud_evaluations_batch(
+    fens: Sequence[str],
+    multi_pv: int = 2,
+    timeout: int = 10,
+    cache_path: Optional[str] = None
+) -> List[Optional[List[EngineLine]]]:
+    """
+    Get cloud evaluations for many positions concurrently.
+    
+    Args:
+        fens: Positions in FEN notation
+        multi_pv: Number of principal variations to request
+        timeout: Request timeout in seconds
+        cache_path: On-disk cache of responses shared between runs
+                    (if None, responses are only cached in memory)
+        
+    Returns:
+        Engine lines for each position, in the same order as fens.
+        None for positions whose cloud evaluation failed, and for all
+        remaining positions once the API is unreachable.
+    """
+    if not fens:
+        return []
+    
+    unreachable = threading.Event()
+    
+    def evaluate(fen: str) -> Optional[List[EngineLine]]:
+        if unreachable.is_set():
+            return None
+        
+        try:
+            return get_cloud_evaluation(fen, multi_pv, timeout, cache_path)
+        except Exception as e:
+            if isinstance(e.__cause__, requests.ConnectionError):
+                unreachable.set()
+            return None
+    
+    # Probe with the first position, so an offline run fails once instead
+    # of once per position
+    first_result = evaluate(fens[0])
+    if unreachable.is_set() or len(fens) == 1:
+        return [first_result] + [None] * (len(fens) - 1)
+    
+    max_workers = min(CLOUD_BATCH_CONCURRENCY, len(fens) - 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return [first_result] + list(executor.map(evaluate, fens[1:]))
+
+
+def _request_with_backoff(url: str, timeout: int) -> requests.Response:
+    """
+    Send a GET request, backing off exponentially while rate limited.
+    
+    Gives up when the server asks for a longer wait than
+    CLOUD_MAX_RETRY_DELAY, so callers fall back to the local engine
+    instead of blocking.
+    
+    Args:
+        url: Request URL
+        timeout: Request timeout in seconds
+        
+    Returns:
+        Last response received
+    """
+    delay = 1.0
+    
+    for _ in range(CLOUD_MAX_RETRIES):
+        response = _SESSION.get(url, timeout=timeout)
+        if response.status_code != 429:
+            return response
+        
+        # Honour the server's Retry-After header when it sends one, but
+        # never block a worker for longer than the cap
+        retry_after = response.headers.get("Retry-After", "")
+        wait = float(retry_after) if retry_after.isdigit() else delay
+        if wait > CLOUD_MAX_RETRY_DELAY:
+            return response
+        
+        time.sleep(wait)
+        delay *= 2
+    
+    return _SESSION.get(url, timeout=timeout)
+
+
+def _get_cloud_payload(
+    fen: str,
+    multi_pv: int,
+    timeout: int,
+    cache_path: Optional[str] = None
+) -> dict:
+    """
+    Get the raw cloud evaluation response for a position.
+    
+    Cloud evaluations do not change once stored, so given a cache path
+    responses are read from and written to disk. Failed requests are not
+    cached.
+    
+    Args:
+        fen: Position in FEN notation
+        multi_pv: Number of principal variations to request
+        timeout: Request timeout in seconds
+        cache_path: On-disk cache of responses (if None, none is used)
+        
+    Returns:
+        JSON response from Lichess API
+        
+    Raises:
+        Exception: If cloud evaluation fails
+    """
+    if cache_path is not None:
+        data = _read_cached_payload(cache_path, fen, multi_pv)
+        if data is not None:
+            return data
+    
     url = f"https://lichess.org/api/cloud-eval?fen={fen}&multiPv={multi_pv}"
     
     try:
-        response = requests.get(url, timeout=timeout)
+        response = _request_with_backoff(url, timeout)
         response.raise_for_status()
     except requests.RequestException as e:
-        raise Exception(f"Cloud evaluation failed: {e}")
+        raise Exception(f"Cloud evaluation failed: {e}") from e
     
-    data = response.json()
+    data = json_loads(response.content)
+    if cache_path is not None:
+        _write_cached_payload(
+            cache_path, fen, multi_pv, data.get("depth", 0), response.content
+        )
     
-    # Parse response
-    engine_lines = _parse_lichess_response(fen, data)
+    return data
+
+
+def _read_cached_payload(
+    cache_path: str,
+    fen: str,
+    multi_pv: int
+) -> Optional[dict]:
+    """
+    Look up a cached response with at least multi_pv principal variations.
     
-    return engine_lines
+    Args:
+        cache_path: Path of the cache database
+        fen: Position in FEN notation
+        multi_pv: Number of principal variations requested
+        
+    Returns:
+        JSON response trimmed to multi_pv lines, or None on a cache miss
+    """
+    with open_cache(cache_path, _CACHE_SCHEMA) as connection:
+        if connection is None:
+            return None
+        
+        try:
+            row = connection.execute(
+                "SELECT payload FROM evals WHERE fen = ? AND multi_pv >= ? "
+                "ORDER BY multi_pv LIMIT 1",
+                (fen, multi_pv)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+    
+    if row is None:
+        return None
+    
+    data = json_loads(row[0])
+    if "pvs" in data:
+        data["pvs"] = data["pvs"][:multi_pv]
+    
+    return data
+
+
+def _write_cached_payload(
+    cache_path: str,
+    fen: str,
+    multi_pv: int,
+    depth: int,
+    payload: bytes
+) -> None:
+    """
+    Store a raw response in the on-disk cache.
+    
+    Args:
+        cache_path: Path of the cache database
+        fen: Position in FEN notation
+        multi_pv: Number of principal variations requested
+        depth: Depth of the cloud evaluation
+        payload: Raw JSON response body
+    """
+    with open_cache(cache_path, _CACHE_SCHEMA) as connection:
+        if connection is None:
+            return
+        
+        try:
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO evals VALUES (?, ?, ?, ?)",
+                    (fen, multi_pv, depth, payload)
+                )
+        except sqlite3.Error:
+            pass
 
 
 def _parse_lichess_response(fen: str, data: dict) -> List[EngineLine]:
@@ -69,6 +328,9 @@ def _parse_lichess_response(fen: str, data: dict) -> List[EngineLine]:
     depth = data.get("depth", 0)
     pvs = data["pvs"]
     
+    # Parse the position once; each PV is played out on a copy
+    root_board = chess.Board(fen)
+    
     for idx, pv in enumerate(pvs):
         # Parse moves
         moves_str = pv.get("moves", "")
@@ -76,7 +338,7 @@ def _parse_lichess_response(fen: str, data: dict) -> List[EngineLine]:
             continue
         
         uci_moves = moves_str.split()
-        moves = _convert_uci_moves_to_san(fen, uci_moves)
+        moves = _convert_uci_moves_to_san(root_board, uci_moves)
         
         # Determine evaluation type and value
         if "mate" in pv:
@@ -106,19 +368,26 @@ def _parse_lichess_response(fen: str, data: dict) -> List[EngineLine]:
     return engine_lines
 
 
-def _convert_uci_moves_to_san(fen: str, uci_moves: List[str]) -> List[Move]:
+def _convert_uci_moves_to_san(
+    position: Union[str, chess.Board],
+    uci_moves: List[str]
+) -> List[Move]:
     """
     Convert UCI moves to SAN notation.
     
     Args:
-        fen: Starting position FEN
+        position: Starting position FEN, or an already parsed board
+                  (left unchanged)
         uci_moves: List of UCI move strings
         
     Returns:
         List of Move objects with both SAN and UCI
     """
     moves: List[Move] = []
-    board = chess.Board(fen)
+    if isinstance(position, str):
+        board = chess.Board(position)
+    else:
+        board = position.copy(stack=False)
     
     for uci_str in uci_moves:
         # Normalize Lichess castling notation
@@ -128,17 +397,11 @@ def _convert_uci_moves_to_san(fen: str, uci_moves: List[str]) -> List[Move]:
             # Parse UCI move
             move = chess.Move.from_uci(uci_normalized)
             
-            # Get SAN
-            san = board.san(move)
-            
-            # Make move
-            board.push(move)
+            # Get SAN and make move in one step
+            san = board.san_and_push(move)
             
-            # Create Move object
-            moves.append(Move(
-                san=san,
-                uci=move.uci()
-            ))
+            # Create Move object (positional arguments, once per PV move)
+            moves.append(Move(san, move.uci()))
         except (ValueError, chess.IllegalMoveError):
             # Stop on invalid move
             break
@@ -0,0 +1,78 @@
+"""
+On-Disk Result Caches
+
+Shared SQLite connections for the engine and cloud evaluation caches,
+opened on first use and kept per database path.
+"""
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Set, Tuple
+import sqlite3
+import threading
+
+
+_connections: Dict[str, sqlite3.Connection] = {}
+_created_tables: Set[Tuple[str, str]] = set()
+
+# Connections are shared between threads, so all use goes through one lock
+_lock = threading.Lock()
+
+
+@contextmanager
+def open_cache(
+    cache_path: str,
+    schema: str
+) -> Iterator[Optional[sqlite3.Connection]]:
+    """
+    Use an on-disk cache, creating it on first use.
+    
+    The connection may only be used inside the with block, which holds
+    the lock shared by all caches.
+    
+    Args:
+        cache_path: Path of the cache database
+        schema: CREATE TABLE IF NOT EXISTS statement of the cache table
+        
+    Yields:
+        Cache connection, or None if the cache cannot be opened
+    """
+    with _lock:
+        yield _get_connection(cache_path, schema)
+
+
+def close_caches() -> None:
+    """Close every open on-disk cache."""
+    with _lock:
+        for connection in _connections.values():
+            connection.close()
+        
+        _connections.clear()
+        _created_tables.clear()
+
+
+def _get_connection(cache_path: str, schema: str) -> Optional[sqlite3.Connection]:
+    """
+    Get the connection of a cache, opening it and creating its table if needed.
+    
+    Args:
+        cache_path: Path of the cache database
+        schema: CREATE TABLE IF NOT EXISTS statement of the cache table
+        
+    Returns:
+        Cache connection, or None if the cache cannot be opened
+    """
+    try:
+        connection = _connections.get(cache_path)
+        if connection is None:
+            Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(cache_path, check_same_thread=False)
+            _connections[cache_path] = connection
+        
+        if (cache_path, schema) not in _created_tables:
+            connection.execute(schema)
+            _created_tables.add((cache_path, schema))
+    except (OSError, sqlite3.Error):
+        return None
+    
+    return connection
@@ -0,0 +1,225 @@
+"""
+Local Engine Pool
+
+Runs several single-threaded UCI engines side by side so that many
+positions can be analyzed concurrently. Concurrent single-threaded
+searches scale better across positions than one multi-threaded search.
+
+Also keeps a process-wide set of idle engines that callers borrow with
+borrow_engine(), so short-lived analyses skip the engine start-up cost.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+import os
+import queue
+import threading
+
+from ..models.state_tree import EngineLine
+from ..models.enums import EngineVersion
+from ..config import EngineConfig
+from .uci_engine import UCIEngine
+
+
+# Idle shared engines, keyed by (engine path, version, cache path)
+_shared_engines: Dict[
+    Tuple[Optional[str], EngineVersion, Optional[str]], "queue.Queue[UCIEngine]"
+] = {}
+_shared_engines_lock = threading.Lock()
+_shutdown_watcher: Optional[threading.Thread] = None
+
+
+@contextmanager
+def borrow_engine(
+    version: EngineVersion = EngineVersion.STOCKFISH_17,
+    engine_path: Optional[str] = None,
+    cache_path: Optional[str] = None
+) -> Iterator[UCIEngine]:
+    """
+    Borrow an engine from the process-wide pool.
+    
+    Reuses an idle engine when one is available and starts a new one
+    otherwise. The engine is returned to the pool on exit, or terminated
+    if the block raised. Each borrow starts a new game, so the hash table
+    is only reused for positions analyzed within one borrow.
+    
+    Args:
+        version: Engine version identifier
+        engine_path: Path to engine binary (if None, searches PATH)
+        cache_path: On-disk cache of engine results (if None, none is used)
+        
+    Yields:
+        UCIEngine ready for analysis
+        
+    Example:
+        >>> with borrow_engine() as engine:
+        ...     engine.set_position(fen)
+        ...     lines = engine.evaluate(depth=16)
+    """
+    global _shutdown_watcher
+    
+    with _shared_engines_lock:
+        idle_engines = _shared_engines.setdefault(
+            (engine_path, version, cache_path),
+            queue.Queue()
+        )
+        
+        if _shutdown_watcher is None:
+            _shutdown_watcher = threading.Thread(
+                target=_terminate_shared_engines_on_exit,
+                name="engine-pool-shutdown",
+                daemon=True
+            )
+            _shutdown_watcher.start()
+    
+    try:
+        engine = idle_engines.get_nowait()
+    except queue.Empty:
+        engine = UCIEngine(
+            engine_path=engine_path,
+            version=version,
+            cache_path=cache_path
+        )
+    
+    engine.new_game()
+    
+    try:
+        yield engine
+    except BaseException:
+        engine.terminate()
+        raise
+    
+    idle_engines.put(engine)
+
+
+def _terminate_shared_engines_on_exit() -> None:
+    """
+    Terminate all idle shared engines once the main thread finishes.
+    
+    python-chess runs each engine on a non-daemon thread, which the
+    interpreter joins before atexit handlers run, so the engines have to
+    be shut down from a daemon thread watching the main thread instead.
+    """
+    threading.main_thread().join()
+    
+    with _shared_engines_lock:
+        idle_queues = list(_shared_engines.values())
+        _shared_engines.clear()
+    
+    for idle_engines in idle_queues:
+        while True:
+            try:
+                engine = idle_engines.get_nowait()
+            except queue.Empty:
+                break
+            
+            try:
+                engine.terminate()
+            except Exception:
+                pass
+
+
+class EnginePool:
+    """
+    Pool of single-threaded UCI engine processes.
+    
+    Each engine is checked out by one worker thread at a time. Threads are
+    sufficient because the search runs in the engine subprocesses and the
+    workers only wait on their I/O.
+    
+    Example:
+        >>> with EnginePool(EngineConfig(depth=12)) as pool:
+        ...     results = pool.analyze_many(fens)
+    """
+    
+    def __init__(
+        self,
+        config: Optional[EngineConfig] = None,
+        size: Optional[int] = None,
+        version: EngineVersion = EngineVersion.STOCKFISH_17
+    ):
+        """
+        Start the engine processes.
+        
+        Args:
+            config: Engine configuration (uses defaults if None)
+            size: Number of engines (default: number of CPUs)
+            version: Engine version identifier
+        """
+        self.config = config if config is not None else EngineConfig()
+        self.size = size or os.cpu_count() or 1
+        
+        self._engines: List[UCIEngine] = []
+        self._idle_engines: "queue.Queue[UCIEngine]" = queue.Queue()
+        
+        try:
+            for _ in range(self.size):
+                engine = UCIEngine(
+                    engine_path=self.config.stockfish_path,
+                    version=version,
+                    cache_path=self.config.engine_cache_path
+                )
+                self._engines.append(engine)
+                
+                engine.set_option("Threads", 1)
+                self._idle_engines.put(engine)
+        except Exception:
+            self.terminate()
+            raise
+        
+        self._executor = ThreadPoolExecutor(max_workers=self.size)
+    
+    def analyze(self, fen: str) -> List[EngineLine]:
+        """
+        Analyze a single position on the next idle engine.
+        
+        Args:
+            fen: Position in FEN notation
+            
+        Returns:
+            List of engine lines
+        """
+        engine = self._idle_engines.get()
+        
+        try:
+            engine.set_position(fen)
+            return engine.evaluate(
+                depth=self.config.depth,
+                multi_pv=self.config.multi_pv,
+                time_limit=self.config.time_limit
+            )
+        finally:
+            self._idle_engines.put(engine)
+    
+    def analyze_many(self, fens: Sequence[str]) -> List[List[EngineLine]]:
+        """
+        Analyze positions concurrently across all engines.
+        
+        Args:
+            fens: Positions in FEN notation
+            
+        Returns:
+            Engine lines for each position, in the same order as fens
+        """
+        return list(self._executor.map(self.analyze, fens))
+    
+    def terminate(self) -> None:
+        """Shut down the worker threads and all engine processes."""
+        executor = getattr(self, "_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=True)
+        
+        for engine in self._engines:
+            try:
+                engine.terminate()
+            except Exception:
+                pass
+        
+        self._engines = []
+    
+    def __enter__(self) -> "EnginePool":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.terminate()
@@ -5,16 +5,30 @@ Provides communication with UCI-compatible chess engines (e.g., Stockfish).
 Supports MultiPV analysis and asynchronous evaluation.
 """
 
-from typing import List, Optional, Callable
-import subprocess
-import re
+from collections import OrderedDict
+from typing import List, Optional, Callable, Dict, Sequence, Tuple
 import chess
+import chess.engine
+import json
 import shutil
+import sqlite3
 
 from ..models.state_tree import EngineLine, Evaluation, Move
 from ..models.enums import EngineVersion
-from ..utils.chess_utils import is_black_to_move
+from ..utils.chess_utils import get_position_key
 from ..constants import STARTING_FEN
+from .disk_cache import open_cache
+
+
+ANALYSIS_CACHE_SIZE = 10_000
+"""Maximum number of (position key, MultiPV) results kept per engine."""
+
+# Table of the on-disk cache of engine lines
+_CACHE_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS lines ("
+    "engine TEXT, position TEXT, multi_pv INTEGER, depth INTEGER, "
+    "lines TEXT, PRIMARY KEY (engine, position, multi_pv))"
+)
 
 
 class UCIEngine:
@@ -22,12 +36,28 @@ class UCIEngine:
     UCI chess engine interface.
     
     Supports communication with UCI-compatible engines like Stockfish.
+    Process management and UCI protocol handling are delegated to
+    python-chess's engine module.
+    
+    Positions set with a root FEN and the moves leading to them are sent
+    as "position fen <root> moves ...", and the engine's hash table is kept
+    between searches until new_game() is called, so consecutive positions
+    of one game reuse earlier search results. A new game is also started
+    whenever a position does not continue the previous one.
+    
+    Results are also cached per (position, MultiPV) and reused whenever an
+    earlier search of the same position already reached the requested depth.
+    The fullmove number is left out of the cache key, so transpositions and
+    repeated opening positions across games hit the cache too. Given a
+    cache path, results are also kept on disk per engine name, so later
+    runs reuse them as well.
     """
     
     def __init__(
         self,
         engine_path: Optional[str] = None,
-        version: EngineVersion = EngineVersion.STOCKFISH_17
+        version: EngineVersion = EngineVersion.STOCKFISH_17,
+        cache_path: Optional[str] = None
     ):
         """
         Initialize UCI engine.
@@ -35,9 +65,18 @@ class UCIEngine:
         Args:
             engine_path: Path to engine binary (if None, searches PATH)
             version: Engine version identifier
+            cache_path: On-disk cache of results shared between runs
+                        (if None, results are only cached in memory)
         """
         self.version = version
+        self.cache_path = cache_path
         self.position = STARTING_FEN
+        self.board = chess.Board(STARTING_FEN)
+        self._root_fen = STARTING_FEN
+        self._moves: List[str] = []
+        self._game = object()
+        self._analysis_cache: "OrderedDict[Tuple[str, int], List[EngineLine]]" = OrderedDict()
+        self.engine: Optional[chess.engine.SimpleEngine] = None
         
         # Find engine binary
         if engine_path is None:
@@ -50,54 +89,98 @@ class UCIEngine:
         
         # Start engine process
         try:
-            self.process = subprocess.Popen(
-                [engine_path],
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                universal_newlines=True,
-                bufsize=1
-            )
+            self.engine = chess.engine.SimpleEngine.popen_uci(engine_path)
         except FileNotFoundError:
             raise FileNotFoundError(f"Engine binary not found at: {engine_path}")
         except Exception as e:
             raise Exception(f"Failed to start engine: {e}")
         
-        # Initialize engine
-        self._send_command("uci")
-        self._wait_for_response("uciok")
-        self._send_command("ucinewgame")
-        self._send_command("isready")
-        self._wait_for_response("readyok")
+        # Results on disk are kept apart per engine build
+        self._engine_name = self.engine.id.get("name", version.value)
     
-    def _send_command(self, command: str) -> None:
-        """Send command to engine."""
-        if self.process.stdin:
-            self.process.stdin.write(command + "\n")
-            self.process.stdin.flush()
-    
-    def _wait_for_response(self, expected: str, timeout: int = 10) -> None:
-        """Wait for specific response from engine."""
-        import time
-        start_time = time.time()
-        
-        while time.time() - start_time < timeout:
-            if self.process.stdout:
-                line = self.process.stdout.readline().strip()
-                if expected in line:
-                    return
-        
-        raise TimeoutError(f"Engine did not respond with '{expected}' within {timeout}s")
+    def set_option(self, name: str, value) -> None:
+        """
+        Set a UCI engine option.
+        
+        Args:
+            name: Option name (e.g., 'Threads', 'Hash')
+            value: Option value
+        """
+        self.engine.configure({name: value})
     
-    def set_position(self, fen: str) -> None:
+    def set_position(self, fen: str, moves: Optional[Sequence[str]] = None) -> None:
         """
         Set current position.
         
+        Starts a new game if the position does not continue the previous
+        one, so unrelated searches never share hash table entries.
+        
         Args:
-            fen: Position in FEN notation
+            fen: Position in FEN notation (the game's root position if
+                 moves are given)
+            moves: UCI moves played from fen to reach the position (optional)
         """
-        self._send_command(f"position fen {fen}")
-        self.position = fen
+        moves = list(moves or ())
+        previous_count = len(self._moves)
+        
+        if (fen == self._root_fen and len(moves) >= previous_count and
+                moves[:previous_count] == self._moves):
+            # Later in the same game: play only the new moves on the
+            # current board instead of replaying the game from its root
+            board = self.board
+            try:
+                for uci in moves[previous_count:]:
+                    board.push_uci(uci)
+            except ValueError:
+                # Leave the previous position in place
+                while len(board.move_stack) > previous_count:
+                    board.pop()
+                raise
+            
+            position = board.fen() if moves else fen
+        else:
+            board = chess.Board(fen)
+            for uci in moves:
+                board.push_uci(uci)
+            
+            position = board.fen() if moves else fen
+            
+            if not self._is_next_position(board, position):
+                self.new_game()
+        
+        self._root_fen = fen
+        self._moves = moves
+        self.board = board
+        self.position = position
+    
+    def _is_next_position(self, board: chess.Board, position: str) -> bool:
+        """
+        Check whether a position is one move on from the previous one.
+        
+        Args:
+            board: Board of the new position
+            position: FEN of the new position
+            
+        Returns:
+            True if a legal move from the previous position reaches it
+        """
+        position_key = get_position_key(position)
+        previous = self.board.copy(stack=False)
+        
+        for move in self.board.legal_moves:
+            previous.push(move)
+            
+            # Only build a FEN for moves that leave the same squares occupied
+            if (previous.occupied == board.occupied and
+                    get_position_key(previous.fen()) == position_key):
+                return True
+            previous.pop()
+        
+        return False
+    
+    def new_game(self) -> None:
+        """Start a new game, clearing the engine's hash table before the next search."""
+        self._game = object()
     
     def evaluate(
         self,
@@ -118,120 +201,192 @@ class UCIEngine:
         Returns:
             List of engine lines
         """
-        # Configure MultiPV
-        self._send_command(f"setoption name MultiPV value {multi_pv}")
-        self._send_command("isready")
-        self._wait_for_response("readyok")
-        
-        # Build go command
-        if time_limit:
-            go_command = f"go depth {depth} movetime {time_limit}"
-        else:
-            go_command = f"go depth {depth}"
+        cache_key = (get_position_key(self.position), multi_pv)
+        cached_lines = self._analysis_cache.get(cache_key)
         
-        # Start evaluation
-        self._send_command(go_command)
+        if not cached_lines or cached_lines[0].depth < depth:
+            stored_lines = self._read_cached_lines(cache_key, depth)
+            if stored_lines:
+                self._remember_lines(cache_key, stored_lines)
+                cached_lines = stored_lines
         
-        # Collect engine lines
-        engine_lines = self._parse_engine_output(on_engine_line)
+        if cached_lines and cached_lines[0].depth >= depth:
+            self._analysis_cache.move_to_end(cache_key)
+            
+            if on_engine_line:
+                for engine_line in cached_lines:
+                    on_engine_line(engine_line)
+            
+            return list(cached_lines)
         
-        return engine_lines
-    
-    def _parse_engine_output(
-        self,
-        on_engine_line: Optional[Callable[[EngineLine], None]] = None
-    ) -> List[EngineLine]:
-        """
-        Parse engine output and extract engine lines.
+        board = self.board
+        limit = chess.engine.Limit(
+            depth=depth,
+            time=time_limit / 1000 if time_limit else None
+        )
         
-        Args:
-            on_engine_line: Optional callback for each line
+        with self.engine.analysis(
+            board,
+            limit,
+            multipv=multi_pv,
+            game=self._game
+        ) as analysis:
+            if on_engine_line:
+                for info in analysis:
+                    if self._is_complete_info(info):
+                        on_engine_line(self._create_engine_line(board, info))
+            else:
+                analysis.wait()
             
-        Returns:
-            List of engine lines
-        """
-        engine_lines: List[EngineLine] = []
-        lines_by_depth_index = {}  # Track latest line for each (depth, index)
+            # Latest info for each MultiPV index
+            infos = [info for info in analysis.multipv if self._is_complete_info(info)]
         
-        while True:
-            if not self.process.stdout:
-                break
-            
-            line = self.process.stdout.readline().strip()
-            
-            # Stop on bestmove
-            if line.startswith("bestmove") or "depth 0" in line:
-                break
-            
-            # Only process info lines
-            if not line.startswith("info depth"):
-                continue
-            
-            # Skip currmove lines
-            if "currmove" in line:
-                continue
-            
-            # Parse the line
-            parsed_line = self._parse_info_line(line)
-            if parsed_line:
-                # Track by (depth, index) to get only final lines
-                key = (parsed_line.depth, parsed_line.index)
-                lines_by_depth_index[key] = parsed_line
-                
-                if on_engine_line:
-                    on_engine_line(parsed_line)
+        engine_lines: List[EngineLine] = []
         
         # Get only the lines with maximum depth for each index
-        if lines_by_depth_index:
-            max_depth = max(line.depth for line in lines_by_depth_index.values())
+        if infos:
+            max_depth = max(info["depth"] for info in infos)
             engine_lines = [
-                line for (depth, _), line in lines_by_depth_index.items()
-                if depth == max_depth
+                self._create_engine_line(board, info)
+                for info in infos
+                if info["depth"] == max_depth
             ]
-            # Sort by index
             engine_lines.sort(key=lambda x: x.index)
+            
+            self._remember_lines(cache_key, engine_lines)
+            self._write_cached_lines(cache_key, engine_lines)
         
-        return engine_lines
+        return list(engine_lines)
+    
+    def _remember_lines(
+        self,
+        cache_key: Tuple[str, int],
+        engine_lines: List[EngineLine]
+    ) -> None:
+        """Keep engine lines in the in-memory cache, evicting the oldest entry when full."""
+        self._analysis_cache[cache_key] = engine_lines
+        self._analysis_cache.move_to_end(cache_key)
+        if len(self._analysis_cache) > ANALYSIS_CACHE_SIZE:
+            self._analysis_cache.popitem(last=False)
     
-    def _parse_info_line(self, line: str) -> Optional[EngineLine]:
+    def _read_cached_lines(
+        self,
+        cache_key: Tuple[str, int],
+        depth: int
+    ) -> Optional[List[EngineLine]]:
         """
-        Parse a single info line from engine output.
+        Look up stored engine lines that reached at least the given depth.
         
         Args:
-            line: Info line from engine
+            cache_key: Position key and MultiPV
+            depth: Minimum search depth
             
         Returns:
-            EngineLine object or None if parsing fails
+            Stored engine lines, or None on a cache miss
         """
-        # Parse depth
-        depth_match = re.search(r'\bdepth (\d+)', line)
-        if not depth_match:
+        if self.cache_path is None:
             return None
-        depth = int(depth_match.group(1))
         
-        # Parse MultiPV index
-        index_match = re.search(r'\bmultipv (\d+)', line)
-        index = int(index_match.group(1)) if index_match else 1
+        with open_cache(self.cache_path, _CACHE_SCHEMA) as connection:
+            if connection is None:
+                return None
+            
+            try:
+                row = connection.execute(
+                    "SELECT lines FROM lines WHERE engine = ? AND position = ? "
+                    "AND multi_pv = ? AND depth >= ?",
+                    (self._engine_name, *cache_key, depth)
+                ).fetchone()
+            except sqlite3.Error:
+                return None
         
-        # Parse evaluation
-        score_match = re.search(r'\bscore (cp|mate) (-?\d+)', line)
-        if not score_match:
+        if row is None:
             return None
         
-        eval_type = "centipawn" if score_match.group(1) == "cp" else "mate"
-        eval_value = int(score_match.group(2))
+        return [
+            EngineLine(
+                evaluation=Evaluation(eval_type, eval_value),
+                source=self.version.value,
+                depth=line_depth,
+                index=index,
+                moves=[Move(san, uci) for san, uci in moves]
+            )
+            for eval_type, eval_value, line_depth, index, moves in json.loads(row[0])
+        ]
+    
+    def _write_cached_lines(
+        self,
+        cache_key: Tuple[str, int],
+        engine_lines: List[EngineLine]
+    ) -> None:
+        """
+        Store engine lines in the on-disk cache.
+        
+        Args:
+            cache_key: Position key and MultiPV
+            engine_lines: Lines of one search depth
+        """
+        if self.cache_path is None:
+            return
+        
+        lines = json.dumps([
+            [
+                line.evaluation.type,
+                line.evaluation.value,
+                line.depth,
+                line.index,
+                [[move.san, move.uci] for move in line.moves]
+            ]
+            for line in engine_lines
+        ])
+        
+        with open_cache(self.cache_path, _CACHE_SCHEMA) as connection:
+            if connection is None:
+                return
+            
+            try:
+                with connection:
+                    connection.execute(
+                        # Never replace deeper stored results with shallower ones
+                        "INSERT INTO lines VALUES (?, ?, ?, ?, ?) "
+                        "ON CONFLICT (engine, position, multi_pv) DO UPDATE SET "
+                        "depth = excluded.depth, lines = excluded.lines "
+                        "WHERE excluded.depth >= lines.depth",
+                        (self._engine_name, *cache_key, engine_lines[0].depth, lines)
+                    )
+            except sqlite3.Error:
+                pass
+    
+    @staticmethod
+    def _is_complete_info(info: Dict) -> bool:
+        """Check that an info carries a scored search result."""
+        return "score" in info and info.get("depth", 0) > 0
+    
+    def _create_engine_line(self, board: chess.Board, info: Dict) -> EngineLine:
+        """
+        Create an engine line from an engine info.
         
+        Args:
+            board: Position that was analyzed
+            info: Info from python-chess analysis
+            
+        Returns:
+            EngineLine object
+        """
         # ⚠️ CRITICAL: Normalize to White's perspective
         # Engine returns evaluation from side-to-move perspective
-        if is_black_to_move(self.position):
-            eval_value = -eval_value
+        score = info["score"].white()
         
-        # Parse principal variation
-        pv_match = re.search(r'\bpv (.+)$', line)
-        uci_moves = pv_match.group(1).split() if pv_match else []
+        mate = score.mate()
+        if mate is not None:
+            eval_type = "mate"
+            eval_value = mate
+        else:
+            eval_type = "centipawn"
+            eval_value = score.score()
         
         # Convert UCI moves to SAN
-        moves = self._convert_uci_to_san(uci_moves)
+        moves = self._convert_pv_to_san(board, info.get("pv", []))
         
         # Create engine line
         engine_line = EngineLine(
@@ -240,36 +395,38 @@ class UCIEngine:
                 value=float(eval_value)
             ),
             source=self.version.value,
-            depth=depth,
-            index=index,
+            depth=info["depth"],
+            index=info.get("multipv", 1),
             moves=moves
         )
         
         return engine_line
     
-    def _convert_uci_to_san(self, uci_moves: List[str]) -> List[Move]:
+    def _convert_pv_to_san(
+        self,
+        board: chess.Board,
+        pv: List[chess.Move]
+    ) -> List[Move]:
         """
-        Convert UCI moves to SAN notation.
+        Convert a principal variation to SAN notation.
         
         Args:
-            uci_moves: List of UCI move strings
+            board: Position the variation starts from
+            pv: List of moves
             
         Returns:
             List of Move objects
         """
         moves: List[Move] = []
-        board = chess.Board(self.position)
+        board = board.copy(stack=False)
         
-        for uci_str in uci_moves:
+        for move in pv:
             try:
-                move = chess.Move.from_uci(uci_str)
-                san = board.san(move)
-                board.push(move)
+                san = board.san_and_push(move)
                 
-                moves.append(Move(
-                    san=san,
-                    uci=move.uci()
-                ))
+                # Positional arguments skip keyword matching in the
+                # dataclass __init__, which adds up over every PV move
+                moves.append(Move(san, move.uci()))
             except (ValueError, chess.IllegalMoveError):
                 break
         
@@ -277,10 +434,10 @@ class UCIEngine:
     
     def terminate(self) -> None:
         """Terminate the engine process."""
-        if self.process:
-            self._send_command("quit")
-            self.process.terminate()
-            self.process.wait(timeout=5)
+        if self.engine:
+            engine = self.engine
+            self.engine = None
+            engine.quit()
     
     def __del__(self):
         """Cleanup on destruction."""
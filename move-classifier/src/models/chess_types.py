@@ -8,8 +8,10 @@ from dataclasses import dataclass
 from typing import Optional
 import chess
 
+from ..constants import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class BoardPiece:
     """Represents a piece on the board with its location and color."""
     
@@ -23,7 +25,7 @@ class BoardPiece:
     """Color of the piece (WHITE or BLACK)."""
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RawMove:
     """Represents a move in simplified format."""
     
@@ -70,13 +72,38 @@ def to_board_piece(raw_move: RawMove) -> BoardPiece:
 def get_board_pieces(board: chess.Board) -> list[BoardPiece]:
     """Get all pieces on the board as BoardPiece objects."""
     pieces = []
-    for square in chess.SQUARES:
-        piece = board.piece_at(square)
-        if piece:
-            pieces.append(BoardPiece(
-                square=square,
-                type=piece.piece_type,
-                color=piece.color
-            ))
+    
+    # Walk occupied squares only and classify them against the piece
+    # bitboards, most common piece types first. Everything the loop touches
+    # is bound to a local first to skip attribute lookups per square
+    pawns, knights, bishops = board.pawns, board.knights, board.bishops
+    rooks, queens = board.rooks, board.queens
+    white = board.occupied_co[chess.WHITE]
+    
+    bb_squares = chess.BB_SQUARES
+    PAWN, KNIGHT, BISHOP = chess.PAWN, chess.KNIGHT, chess.BISHOP
+    ROOK, QUEEN, KING = chess.ROOK, chess.QUEEN, chess.KING
+    append = pieces.append
+    
+    for square in chess.scan_forward(board.occupied):
+        mask = bb_squares[square]
+        
+        if mask & pawns:
+            piece_type = PAWN
+        elif mask & knights:
+            piece_type = KNIGHT
+        elif mask & bishops:
+            piece_type = BISHOP
+        elif mask & rooks:
+            piece_type = ROOK
+        elif mask & queens:
+            piece_type = QUEEN
+        else:
+            piece_type = KING
+        
+        append(BoardPiece(
+            square=square,
+            type=piece_type,
+            color=bool(mask & white)
+        ))
     return pieces
-
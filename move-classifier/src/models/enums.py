@@ -7,6 +7,8 @@ All enumeration types used in the classification system.
 from enum import Enum
 from dataclasses import dataclass
 
+from ..constants import DATACLASS_SLOTS
+
 
 class PieceColor(str, Enum):
     """Chess piece colors."""
@@ -67,7 +69,7 @@ CLASSIFICATION_VALUES = {
 }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MoveClassificationResult:
     """
     Result of move classification including primary classification
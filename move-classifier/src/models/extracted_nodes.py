@@ -8,10 +8,11 @@ Matches JavaScript interfaces from ExtractedNode.ts
 from typing import Optional, Any
 from dataclasses import dataclass
 
+from ..constants import DATACLASS_SLOTS
 from .state_tree import BoardState, EngineLine, Move, Evaluation
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ExtractedPreviousNode:
     """
     Represents the position BEFORE a move was played.
@@ -51,7 +52,7 @@ class ExtractedPreviousNode:
     """Move that was actually played (OPTIONAL for previous node)."""
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ExtractedCurrentNode:
     """
     Represents the position AFTER a move was played.
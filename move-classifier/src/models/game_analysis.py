@@ -7,10 +7,11 @@ Complete analysis results for a chess game.
 from dataclasses import dataclass
 from typing import Optional
 
+from ..constants import DATACLASS_SLOTS
 from .state_tree import StateTreeNode
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class EstimatedRatings:
     """Estimated player ratings based on move accuracy."""
     
@@ -21,7 +22,7 @@ class EstimatedRatings:
     """Estimated Elo rating for Black."""
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GameAnalysis:
     """Complete analysis result for a chess game."""
     
@@ -4,11 +4,13 @@ State Tree Data Structures
 Represents the game as a tree structure with nodes for each position.
 """
 
-from typing import Optional, List
+from typing import Optional, List, NamedTuple
 from dataclasses import dataclass, field
 
+from ..constants import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class Move:
     """Represents a chess move in multiple notations."""
     
@@ -19,9 +21,14 @@ class Move:
     """Universal Chess Interface notation (e.g., 'g1f3')."""
 
 
-@dataclass
-class Evaluation:
-    """Represents an engine evaluation of a position."""
+class Evaluation(NamedTuple):
+    """
+    Represents an engine evaluation of a position.
+    
+    A NamedTuple rather than a dataclass: evaluations are created for
+    every engine line and subjective view, never mutated, and tuples are
+    cheaper to build and hashable.
+    """
     
     type: str  # "centipawn" or "mate"
     """Type of evaluation."""
@@ -30,7 +37,7 @@ class Evaluation:
     """Evaluation value (centipawns or mate moves)."""
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class EngineLine:
     """Represents a single engine analysis line (MultiPV)."""
     
@@ -50,7 +57,7 @@ class EngineLine:
     """Principal variation (sequence of best moves)."""
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BoardState:
     """Complete data for a single chess position."""
     
@@ -76,7 +83,7 @@ class BoardState:
     """Opening name (if applicable)."""
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class StateTreeNode:
     """Represents a single position in the game tree."""
     
@@ -12,20 +12,29 @@ Stages:
     5. Calculate Derived Values
 """
 
-from typing import Optional, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Optional, List, Sequence, Tuple
+import multiprocessing
 
-from ..models.state_tree import StateTreeNode
+from ..models.state_tree import StateTreeNode, EngineLine
 from ..models.extracted_nodes import ExtractedPreviousNode, ExtractedCurrentNode
 from ..config import EngineConfig
 
-from .parser import parse_pgn_game
+from .parser import parse_pgn_game, iter_pgn_games
 from .engine_analyzer import analyze_state_tree
-from .node_chain_builder import get_node_chain
+from .node_chain_builder import get_node_chain, iter_node_chain, iter_mainline
 from .node_extractor import (
     extract_previous_state_tree_node,
-    extract_current_state_tree_node
+    extract_current_state_tree_node,
+    safe_line_move
+)
+from .calculator import (
+    calculate_move_metrics,
+    calculate_accuracies,
+    apply_accuracies,
+    apply_calculations_to_node
 )
-from .calculator import calculate_move_metrics, apply_calculations_to_node
 
 
 def run_full_preprocessing_pipeline(
@@ -64,23 +73,103 @@ def run_full_preprocessing_pipeline(
     # Stage 2: Engine Analysis
     analyze_state_tree(root_node, config)
     
-    # Stage 3: Build Node Chain (for iteration)
-    nodes = get_node_chain(root_node, expand_all_variations=False)
+    _calculate_derived_values(root_node)
+    
+    return root_node
+
+
+def run_preprocessing_pipeline_batch(
+    pgns: Sequence[str],
+    initial_position: Optional[str] = None,
+    config: Optional[EngineConfig] = None,
+    max_workers: Optional[int] = None
+) -> List[StateTreeNode]:
+    """
+    Run the complete preprocessing pipeline for many games in parallel.
+    
+    Games are independent and engine analysis dominates the pipeline, so
+    stages 1-2 run in worker processes, each with its own engine. Workers
+    send back only the engine lines; the state trees are rebuilt here,
+    which is cheap and avoids pickling deeply linked trees.
+    
+    Workers are started with the "spawn" method, so scripts calling this
+    need the usual ``if __name__ == "__main__":`` guard.
+    
+    Args:
+        pgns: PGN strings, one per game
+        initial_position: Optional starting FEN shared by all games
+        config: Engine configuration (uses defaults if None)
+        max_workers: Number of worker processes (default: number of CPUs)
+        
+    Returns:
+        Root nodes of the analyzed state trees, in the same order as pgns
+    """
+    if config is None:
+        config = EngineConfig()
+    
+    # Spawn rather than fork: forked workers would inherit the parent's
+    # engine handles without the threads that drive them
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        games_engine_lines = list(executor.map(
+            _analyze_game_engine_lines,
+            pgns,
+            repeat(initial_position),
+            repeat(config)
+        ))
     
-    # Stage 4 & 5: Extract and Calculate for each node
-    for i in range(1, len(nodes)):  # Skip root
-        node = nodes[i]
-        parent = nodes[i - 1]
+    root_nodes: List[StateTreeNode] = []
+    
+    for pgn, engine_lines in zip(pgns, games_engine_lines):
+        root_node = parse_pgn_game(pgn, initial_position)
         
-        # Extract nodes
-        previous_node = extract_previous_state_tree_node(parent)
-        current_node = extract_current_state_tree_node(node)
+        for node, lines in zip(iter_mainline(root_node), engine_lines):
+            node.state.engine_lines = lines
         
-        # Calculate and apply metrics
-        if previous_node and current_node:
-            apply_calculations_to_node(node, previous_node, current_node)
+        _calculate_derived_values(root_node)
+        root_nodes.append(root_node)
     
-    return root_node
+    return root_nodes
+
+
+def _analyze_game_engine_lines(
+    pgn: str,
+    initial_position: Optional[str],
+    config: EngineConfig
+) -> List[List[EngineLine]]:
+    """
+    Run stages 1-2 for one game in a worker process.
+    
+    Args:
+        pgn: PGN string
+        initial_position: Optional starting FEN
+        config: Engine configuration
+        
+    Returns:
+        Engine lines of each mainline position, root first
+    """
+    root_node = parse_pgn_game(pgn, initial_position)
+    analyze_state_tree(root_node, config)
+    
+    return [node.state.engine_lines for node in iter_mainline(root_node)]
+
+
+def _calculate_derived_values(root_node: StateTreeNode) -> None:
+    """
+    Run stages 3-5 on an analyzed state tree.
+    
+    Args:
+        root_node: Root of a state tree with engine lines
+    """
+    # Stage 3: Walk the node chain (mainline) without materializing it
+    nodes = iter_mainline(root_node)
+    next(nodes)  # Skip root
+    
+    # Stages 4-5: Extract the evaluations around each move and calculate
+    # the accuracy of the whole game at once
+    apply_accuracies(nodes)
 
 
 def extract_node_pair(
@@ -99,7 +188,10 @@ def extract_node_pair(
         return None
     
     previous_node = extract_previous_state_tree_node(node.parent)
-    current_node = extract_current_state_tree_node(node)
+    current_node = extract_current_state_tree_node(
+        node,
+        previous_node.board if previous_node else None
+    )
     
     if previous_node and current_node:
         return (previous_node, current_node)
@@ -109,13 +201,20 @@ def extract_node_pair(
 
 __all__ = [
     "parse_pgn_game",
+    "iter_pgn_games",
     "analyze_state_tree",
     "get_node_chain",
+    "iter_node_chain",
+    "iter_mainline",
     "extract_previous_state_tree_node",
     "extract_current_state_tree_node",
+    "safe_line_move",
     "calculate_move_metrics",
+    "calculate_accuracies",
+    "apply_accuracies",
     "apply_calculations_to_node",
     "run_full_preprocessing_pipeline",
+    "run_preprocessing_pipeline_batch",
     "extract_node_pair",
 ]
 
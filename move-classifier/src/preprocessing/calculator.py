@@ -11,20 +11,24 @@ Note: Most calculation functions are in utils/evaluation_utils.py
 This module provides the Stage 5 interface for applying calculations.
 """
 
-from typing import Optional, Tuple
+from typing import Iterable, Optional, Tuple, List, Sequence
+import chess
 
-from ..models.state_tree import StateTreeNode
+from ..models.state_tree import Evaluation, StateTreeNode
 from ..models.extracted_nodes import ExtractedPreviousNode, ExtractedCurrentNode
 from ..models.enums import PieceColor
 from ..utils.evaluation_utils import (
     get_expected_points,
     get_expected_points_loss,
-    get_move_accuracy,
+    get_move_accuracies,
+    get_accuracy_from_point_loss,
     get_subjective_evaluation
 )
+from ..preprocessing.engine_analyzer import get_top_engine_line
 from ..preprocessing.node_extractor import (
     extract_previous_state_tree_node,
-    extract_current_state_tree_node
+    extract_current_state_tree_node,
+    safe_line_move
 )
 
 
@@ -54,16 +58,106 @@ def calculate_move_metrics(
         player_color
     )
     
-    # Calculate accuracy
-    accuracy = get_move_accuracy(
-        previous_node.evaluation,
-        current_node.evaluation,
-        player_color
-    )
+    # Calculate accuracy from the same point loss
+    accuracy = get_accuracy_from_point_loss(point_loss)
     
     return point_loss, accuracy
 
 
+def calculate_accuracies(
+    previous_nodes: Sequence[ExtractedPreviousNode],
+    current_nodes: Sequence[ExtractedCurrentNode]
+) -> List[float]:
+    """
+    Calculate accuracy for a sequence of moves in a single batch.
+    
+    Args:
+        previous_nodes: Positions before each move
+        current_nodes: Positions after each move
+        
+    Returns:
+        Accuracy for each move, in order
+    """
+    return get_move_accuracies(
+        [previous_node.evaluation for previous_node in previous_nodes],
+        [current_node.evaluation for current_node in current_nodes],
+        [
+            PieceColor.WHITE if previous_node.board.turn else PieceColor.BLACK
+            for previous_node in previous_nodes
+        ]
+    )
+
+
+def apply_accuracies(nodes: Iterable[StateTreeNode]) -> None:
+    """
+    Calculate and store the accuracy of many moves in a single batch.
+    
+    Moves whose evaluations cannot be extracted are left unchanged.
+    
+    Args:
+        nodes: State tree nodes of the moves (not the root)
+    """
+    calculated_nodes: List[StateTreeNode] = []
+    previous_evaluations: List[Evaluation] = []
+    current_evaluations: List[Evaluation] = []
+    move_colors: List[PieceColor] = []
+    
+    for node in nodes:
+        evaluation_pair = _extract_evaluation_pair(node)
+        if evaluation_pair is None:
+            continue
+        
+        calculated_nodes.append(node)
+        previous_evaluations.append(evaluation_pair[0])
+        current_evaluations.append(evaluation_pair[1])
+        move_colors.append(evaluation_pair[2])
+    
+    accuracies = get_move_accuracies(
+        previous_evaluations,
+        current_evaluations,
+        move_colors
+    )
+    for node, accuracy in zip(calculated_nodes, accuracies):
+        node.state.accuracy = accuracy
+
+
+def _extract_evaluation_pair(
+    node: StateTreeNode
+) -> Optional[Tuple[Evaluation, Evaluation, PieceColor]]:
+    """
+    Get only what the accuracy of a move needs, without full node extraction.
+    
+    Succeeds exactly when both extract_previous_state_tree_node(node.parent)
+    and extract_current_state_tree_node(node) would, but builds one board
+    and no extracted node objects.
+    
+    Args:
+        node: State tree node of the move
+        
+    Returns:
+        Tuple of (previous evaluation, current evaluation, move color),
+        or None if extraction fails
+    """
+    parent = node.parent
+    if parent is None or node.state.move is None:
+        return None
+    
+    previous_line = get_top_engine_line(parent)
+    current_line = get_top_engine_line(node)
+    if not previous_line or not current_line or not previous_line.moves:
+        return None
+    
+    # Both the best move and the played move must be legal before the move
+    parent_board = chess.Board(parent.state.fen)
+    if (safe_line_move(parent_board, previous_line.moves[0]) is None or
+            safe_line_move(parent_board, node.state.move) is None):
+        return None
+    
+    move_color = PieceColor.WHITE if parent_board.turn else PieceColor.BLACK
+    
+    return previous_line.evaluation, current_line.evaluation, move_color
+
+
 def apply_calculations_to_node(
     node: StateTreeNode,
     previous_node: Optional[ExtractedPreviousNode] = None,
@@ -79,6 +173,11 @@ def apply_calculations_to_node(
         previous_node: Extracted previous node (will extract if None)
         current_node: Extracted current node (will extract if None)
     """
+    if previous_node is None and current_node is None:
+        # Only the evaluations are needed, skip building extracted nodes
+        apply_accuracies([node])
+        return
+    
     # Extract nodes if not provided
     if current_node is None:
         current_node = extract_current_state_tree_node(node)
@@ -5,14 +5,16 @@ Populates engine evaluations for each position in the state tree
 using either cloud evaluation (Lichess API) or local engine (Stockfish UCI).
 """
 
-from typing import Optional, List
+from contextlib import ExitStack
+from typing import Dict, Optional, List
 import logging
 
-from ..models.state_tree import StateTreeNode
+from ..models.state_tree import EngineLine, StateTreeNode
 from ..config import EngineConfig
-from ..engine.cloud_evaluator import get_cloud_evaluation
-from ..engine.uci_engine import UCIEngine
+from ..engine.cloud_evaluator import get_cloud_evaluations_batch
+from ..engine.engine_pool import EnginePool, borrow_engine
 from ..models.enums import EngineVersion
+from ..utils.chess_utils import get_position_key
 
 
 # Set up logging
@@ -27,6 +29,9 @@ def analyze_state_tree(
     Analyze all positions in the state tree with engine evaluation.
     
     Tries cloud evaluation first (if enabled), falls back to local engine.
+    With config.engine_workers above 1, the remaining positions are split
+    across that many local engines instead of being analyzed in game order
+    on one engine that reuses its hash table.
     
     Args:
         root_node: Root of the state tree
@@ -35,46 +40,89 @@ def analyze_state_tree(
     if config is None:
         config = EngineConfig()
     
-    # Get all nodes in a chain
-    from ..preprocessing.node_chain_builder import get_node_chain
-    nodes = get_node_chain(root_node, expand_all_variations=False)
+    # Get the mainline nodes in order
+    from ..preprocessing.node_chain_builder import iter_mainline
+    nodes = list(iter_mainline(root_node))
     
-    # Initialize local engine (will be used if cloud fails)
+    # Cloud evaluations of every position still missing lines, requested
+    # concurrently up front instead of one round trip per node
+    cloud_lines: Dict[str, Optional[List[EngineLine]]] = {}
+    if config.use_cloud_eval:
+        cloud_fens: Dict[str, str] = {}
+        for node in nodes:
+            if not node.state.engine_lines:
+                cloud_fens.setdefault(get_position_key(node.state.fen), node.state.fen)
+        
+        cloud_lines = dict(zip(
+            cloud_fens,
+            get_cloud_evaluations_batch(
+                list(cloud_fens.values()),
+                multi_pv=config.multi_pv,
+                cache_path=config.cloud_cache_path
+            )
+        ))
+    
+    # Local engine, borrowed from the shared pool if cloud fails
     local_engine = None
     
-    try:
+    # UCI moves from the root to the current node. Local searches send the
+    # game history so the engine reuses its hash table along the mainline
+    uci_moves: List[str] = []
+    
+    # Lines of positions analyzed in this run, so a position with the same
+    # key (equal up to the fullmove number) is not evaluated again
+    analyzed_lines: Dict[str, List[EngineLine]] = {}
+    
+    # Nodes left for the engine pool when analyzing in parallel, by position
+    pending: Dict[str, List[StateTreeNode]] = {}
+    
+    with ExitStack() as stack:
         for node in nodes:
+            if node.state.move:
+                uci_moves.append(node.state.move.uci)
+            
             # Skip if already has engine lines
             if node.state.engine_lines:
                 continue
             
+            position_key = get_position_key(node.state.fen)
+            if position_key in analyzed_lines:
+                node.state.engine_lines.extend(analyzed_lines[position_key])
+                continue
+            
             success = False
             
-            # Try cloud evaluation first (if enabled)
+            # Use the cloud evaluation first (if enabled)
             if config.use_cloud_eval:
-                try:
-                    engine_lines = get_cloud_evaluation(
-                        node.state.fen,
-                        multi_pv=config.multi_pv
+                engine_lines = cloud_lines.get(position_key)
+                if engine_lines:
+                    node.state.engine_lines.extend(engine_lines)
+                    analyzed_lines[position_key] = engine_lines
+                    success = True
+                    logger.debug(f"Cloud evaluation successful for position: {node.id}")
+                else:
+                    logger.debug(
+                        f"Cloud evaluation failed for position: {node.id}, "
+                        "falling back to local engine"
                     )
-                    if engine_lines:
-                        node.state.engine_lines.extend(engine_lines)
-                        success = True
-                        logger.debug(f"Cloud evaluation successful for position: {node.id}")
-                except Exception as e:
-                    logger.debug(f"Cloud evaluation failed: {e}, falling back to local engine")
             
             # Fall back to local engine if cloud failed or disabled
             if not success:
+                if config.engine_workers > 1:
+                    # Analyzed together once all positions are known
+                    pending.setdefault(position_key, []).append(node)
+                    continue
+                
                 if local_engine is None:
-                    # Initialize engine on first use
-                    local_engine = UCIEngine(
+                    # Borrow engine on first use, returned when the analysis ends
+                    local_engine = stack.enter_context(borrow_engine(
+                        version=EngineVersion.STOCKFISH_17,
                         engine_path=config.stockfish_path,
-                        version=EngineVersion.STOCKFISH_17
-                    )
+                        cache_path=config.engine_cache_path
+                    ))
                 
                 # Evaluate with local engine
-                local_engine.set_position(node.state.fen)
+                local_engine.set_position(root_node.state.fen, uci_moves)
                 engine_lines = local_engine.evaluate(
                     depth=config.depth,
                     multi_pv=config.multi_pv,
@@ -83,12 +131,27 @@ def analyze_state_tree(
                 
                 if engine_lines:
                     node.state.engine_lines.extend(engine_lines)
+                    analyzed_lines[position_key] = engine_lines
                     logger.debug(f"Local engine evaluation successful for position: {node.id}")
     
-    finally:
-        # Clean up local engine
-        if local_engine:
-            local_engine.terminate()
+    if pending:
+        # Positions are independent, so spread them over several engines
+        with EnginePool(
+            config,
+            size=min(config.engine_workers, len(pending)),
+            version=EngineVersion.STOCKFISH_17
+        ) as pool:
+            results = pool.analyze_many([
+                repeated_nodes[0].state.fen for repeated_nodes in pending.values()
+            ])
+        
+        for repeated_nodes, engine_lines in zip(pending.values(), results):
+            if not engine_lines:
+                continue
+            
+            for node in repeated_nodes:
+                node.state.engine_lines.extend(engine_lines)
+                logger.debug(f"Local engine evaluation successful for position: {node.id}")
 
 
 def get_top_engine_line(node: StateTreeNode):
@@ -104,16 +167,21 @@ def get_top_engine_line(node: StateTreeNode):
     Returns:
         Best EngineLine or None if no lines available
     """
-    if not node.state.engine_lines:
+    engine_lines = node.state.engine_lines
+    if not engine_lines:
         return None
     
-    # Sort by depth (descending) then index (ascending)
-    sorted_lines = sorted(
-        node.state.engine_lines,
-        key=lambda line: (-line.depth, line.index)
-    )
+    # Highest depth first, then lowest index, keeping the first of equal
+    # lines. Runs several times per node, so the comparison is written
+    # out instead of building a key tuple per line
+    top_line = engine_lines[0]
+    for line in engine_lines:
+        if line.depth > top_line.depth or (
+            line.depth == top_line.depth and line.index < top_line.index
+        ):
+            top_line = line
     
-    return sorted_lines[0] if sorted_lines else None
+    return top_line
 
 
 def get_line_group_sibling(
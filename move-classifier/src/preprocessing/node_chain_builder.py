@@ -5,7 +5,8 @@ Converts the tree structure into a linear array for sequential processing.
 Supports both mainline-only and full variation expansion.
 """
 
-from typing import List
+from collections import deque
+from typing import Deque, Iterator, List, Optional
 
 from ..models.state_tree import StateTreeNode
 
@@ -25,22 +26,53 @@ def get_node_chain(
     Returns:
         List of state tree nodes in order
     """
-    chain: List[StateTreeNode] = []
-    frontier: List[StateTreeNode] = [root_node]
+    return list(iter_node_chain(root_node, expand_all_variations))
+
+
+def iter_node_chain(
+    root_node: StateTreeNode,
+    expand_all_variations: bool = False
+) -> Iterator[StateTreeNode]:
+    """
+    Walk the state tree in node chain order without building a list.
+    
+    Args:
+        root_node: Root of the state tree
+        expand_all_variations: If True, include all variations.
+                               If False, only follow mainline.
+        
+    Yields:
+        State tree nodes in the same order as get_node_chain
+    """
+    if not expand_all_variations:
+        yield from iter_mainline(root_node)
+        return
+    
+    frontier: Deque[StateTreeNode] = deque([root_node])
     
     while frontier:
-        current = frontier.pop(0)  # Use pop(0) for breadth-first
-        chain.append(current)
+        current = frontier.popleft()  # Breadth-first, O(1) per pop
+        yield current
         
-        if expand_all_variations:
-            # Add all children (for variation analysis)
-            frontier.extend(current.children)
-        else:
-            # Add only first child (mainline only)
-            if current.children:
-                frontier.append(current.children[0])
+        # Add all children (for variation analysis)
+        frontier.extend(current.children)
+
+
+def iter_mainline(root_node: StateTreeNode) -> Iterator[StateTreeNode]:
+    """
+    Walk the mainline of the state tree without building a list.
     
-    return chain
+    Args:
+        root_node: Root of the state tree
+        
+    Yields:
+        Mainline nodes in order, starting with the root
+    """
+    current: Optional[StateTreeNode] = root_node
+    while current is not None:
+        yield current
+        children = current.children
+        current = children[0] if children else None
 
 
 def get_mainline_nodes(root_node: StateTreeNode) -> List[StateTreeNode]:
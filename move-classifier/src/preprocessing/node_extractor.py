@@ -10,26 +10,30 @@ Matches JavaScript implementation logic from ExtractNode.ts
 from typing import Optional, Union
 import chess
 
-from ..models.state_tree import StateTreeNode
+from ..models.state_tree import Move, StateTreeNode
 from ..models.extracted_nodes import ExtractedPreviousNode, ExtractedCurrentNode
 from ..models.enums import PieceColor
 from ..utils.evaluation_utils import get_subjective_evaluation
-from ..preprocessing.engine_analyzer import get_line_group_sibling
+from ..preprocessing.engine_analyzer import get_line_group_sibling, get_top_engine_line
 
 
-def _safe_move(fen: str, move: Union[str, chess.Move]) -> Optional[chess.Move]:
+def _safe_move(
+    position: Union[str, chess.Board],
+    move: Union[str, chess.Move]
+) -> Optional[chess.Move]:
     """
     Safely parse and apply a move to a position.
     
     Args:
-        fen: FEN position string
+        position: FEN position string, or an already parsed board
+                  (left unchanged)
         move: Move in SAN format or chess.Move object
         
     Returns:
         chess.Move object if successful, None otherwise
     """
     try:
-        board = chess.Board(fen)
+        board = chess.Board(position) if isinstance(position, str) else position
         if isinstance(move, str):
             return board.parse_san(move)
         else:
@@ -41,34 +45,44 @@ def _safe_move(fen: str, move: Union[str, chess.Move]) -> Optional[chess.Move]:
         return None
 
 
-def _get_top_engine_line(node: StateTreeNode):
+def safe_line_move(board: chess.Board, move: Move) -> Optional[chess.Move]:
     """
-    Get the best engine line for a node.
+    Safely parse a move of the state tree or an engine line.
+    
+    Uses the UCI notation when it is legal, which skips SAN parsing and
+    its legal move generation, and falls back to the SAN otherwise.
     
     Args:
-        node: State tree node
+        board: Board of the position the move is played in (left unchanged)
+        move: Move with SAN and UCI notation
         
     Returns:
-        Best EngineLine or None
+        chess.Move object if successful, None otherwise
     """
-    if not node.state.engine_lines:
-        return None
-    
-    # Sort by depth (descending) then index (ascending)
-    sorted_lines = sorted(
-        node.state.engine_lines,
-        key=lambda line: (-line.depth, line.index)
-    )
+    if move.uci:
+        try:
+            uci_move = chess.Move.from_uci(move.uci)
+        except ValueError:
+            uci_move = None
+        
+        if uci_move and board.is_legal(uci_move):
+            return uci_move
     
-    return sorted_lines[0] if sorted_lines else None
+    return _safe_move(board, move.san)
 
 
-def _extract_second_top_move(node: StateTreeNode, top_line, player_color: PieceColor):
+def _extract_second_top_move(
+    node: StateTreeNode,
+    board: chess.Board,
+    top_line,
+    player_color: PieceColor
+):
     """
     Extract second-best engine line and move.
     
     Args:
         node: State tree node
+        board: Board of the node's position
         top_line: Top engine line
         player_color: Color of the player
         
@@ -85,8 +99,7 @@ def _extract_second_top_move(node: StateTreeNode, top_line, player_color: PieceC
     second_subjective_eval = None
     
     if second_top_line and second_top_line.moves:
-        second_move_san = second_top_line.moves[0].san
-        second_top_move = _safe_move(node.state.fen, second_move_san)
+        second_top_move = safe_line_move(board, second_top_line.moves[0])
         
         if second_top_move and second_top_line.evaluation:
             second_subjective_eval = get_subjective_evaluation(
@@ -112,27 +125,29 @@ def extract_previous_state_tree_node(
         ExtractedPreviousNode or None if extraction fails
     """
     # Get top engine line and move in this position
-    top_line = _get_top_engine_line(node)
+    top_line = get_top_engine_line(node)
     if not top_line:
         return None
     
-    top_move_san = top_line.moves[0].san if top_line.moves else None
-    if not top_move_san:
+    if not top_line.moves:
         return None
     
-    top_move = _safe_move(node.state.fen, top_move_san)
+    # Create board instance for the node, shared by the lookups below
+    board = chess.Board(node.state.fen)
+    
+    top_move = safe_line_move(board, top_line.moves[0])
     if not top_move:
         return None
     
     # Get played move in this position
     played_move = None
     if node.parent and node.state.move:
-        played_move = _safe_move(node.parent.state.fen, node.state.move.san)
+        parent_board = chess.Board(node.parent.state.fen)
+        played_move = safe_line_move(parent_board, node.state.move)
     
     # Determine player color from played move or default to WHITE
     if played_move:
         # Get color from the move by checking which color moved from parent position
-        parent_board = chess.Board(node.parent.state.fen)
         player_color = PieceColor.WHITE if parent_board.turn == chess.WHITE else PieceColor.BLACK
     else:
         # Default to WHITE if no played move (matches JS: playedMove?.color || WHITE)
@@ -146,12 +161,9 @@ def extract_previous_state_tree_node(
     
     # Extract second-best line
     second_top_line, second_top_move, second_subjective_eval = _extract_second_top_move(
-        node, top_line, player_color
+        node, board, top_line, player_color
     )
     
-    # Create board instance for the node
-    board = chess.Board(node.state.fen)
-    
     return ExtractedPreviousNode(
         board=board,
         state=node.state,
@@ -167,7 +179,8 @@ def extract_previous_state_tree_node(
 
 
 def extract_current_state_tree_node(
-    node: StateTreeNode
+    node: StateTreeNode,
+    parent_board: Optional[chess.Board] = None
 ) -> Optional[ExtractedCurrentNode]:
     """
     Extract current node (position after move was played).
@@ -176,6 +189,8 @@ def extract_current_state_tree_node(
     
     Args:
         node: State tree node
+        parent_board: Board of the parent position if already parsed, e.g.
+                      the board of the extracted previous node (left unchanged)
         
     Returns:
         ExtractedCurrentNode or None if extraction fails
@@ -185,25 +200,28 @@ def extract_current_state_tree_node(
         return None
     
     # Get top engine line and move in this position
-    top_line = _get_top_engine_line(node)
+    top_line = get_top_engine_line(node)
     if not top_line:
         return None
     
+    # Create board instance for the node, shared by the lookups below
+    board = chess.Board(node.state.fen)
+    
     # Extract top move (optional for current node)
-    top_move_san = top_line.moves[0].san if top_line.moves else None
-    top_move = _safe_move(node.state.fen, top_move_san) if top_move_san else None
+    top_move = safe_line_move(board, top_line.moves[0]) if top_line.moves else None
     
     # Get played move in this position (REQUIRED)
-    played_move_san = node.state.move.san if node.state.move else None
-    if not played_move_san:
+    if not node.state.move:
         return None
     
-    played_move = _safe_move(node.parent.state.fen, played_move_san)
+    if parent_board is None:
+        parent_board = chess.Board(node.parent.state.fen)
+    
+    played_move = safe_line_move(parent_board, node.state.move)
     if not played_move:
         return None
     
     # Determine player color from the parent board (before move was made)
-    parent_board = chess.Board(node.parent.state.fen)
     player_color = PieceColor.WHITE if parent_board.turn == chess.WHITE else PieceColor.BLACK
     
     # Calculate subjective evaluation (REQUIRED for current node)
@@ -214,12 +232,9 @@ def extract_current_state_tree_node(
     
     # Extract second-best line
     second_top_line, second_top_move, second_subjective_eval = _extract_second_top_move(
-        node, top_line, player_color
+        node, board, top_line, player_color
     )
     
-    # Create board instance for the node
-    board = chess.Board(node.state.fen)
-    
     return ExtractedCurrentNode(
         board=board,
         state=node.state,
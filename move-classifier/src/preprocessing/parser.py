@@ -5,7 +5,8 @@ Converts PGN string into a tree structure representing the game state
 at each position, including variations.
 """
 
-from typing import Optional
+from itertools import islice
+from typing import Iterator, Optional, TextIO
 import chess
 import chess.pgn
 import io
@@ -40,26 +41,60 @@ def parse_pgn_to_state_tree(
     pgn_io = io.StringIO(pgn)
     try:
         game = chess.pgn.read_game(pgn_io)
-        if game is None:
-            # Empty PGN - just return root node with starting position
-            return StateTreeNode(
-                id=generate_unique_id(),
-                mainline=True,
-                parent=None,
-                children=[],
-                state=BoardState(
-                    fen=initial_fen,
-                    move=None,
-                    move_color=None,
-                    engine_lines=[],
-                    classification=None,
-                    accuracy=None,
-                    opening=None
-                )
-            )
     except Exception as e:
         raise ValueError(f"Failed to parse PGN: {e}")
     
+    return _build_state_tree(game, initial_fen)
+
+
+def iter_pgn_games(
+    stream: TextIO,
+    initial_position: Optional[str] = None
+) -> Iterator[StateTreeNode]:
+    """
+    Parse the games of a multi-game PGN stream one at a time.
+    
+    Games are read incrementally from the open stream, so a large PGN
+    database is never loaded into memory as a whole.
+    
+    Args:
+        stream: Open text stream of PGN games (e.g., a file)
+        initial_position: FEN string for starting position (default: standard start)
+        
+    Yields:
+        Root node of each game's state tree, in stream order
+        
+    Raises:
+        ValueError: If a game cannot be parsed
+    """
+    initial_fen = initial_position or STARTING_FEN
+    
+    while True:
+        try:
+            game = chess.pgn.read_game(stream)
+        except Exception as e:
+            raise ValueError(f"Failed to parse PGN: {e}")
+        
+        if game is None:
+            return
+        
+        yield _build_state_tree(game, initial_fen)
+
+
+def _build_state_tree(
+    game: Optional[chess.pgn.Game],
+    initial_fen: str
+) -> StateTreeNode:
+    """
+    Build the state tree of a parsed game.
+    
+    Args:
+        game: Game parsed by python-chess (None for an empty PGN)
+        initial_fen: FEN string for starting position
+        
+    Returns:
+        Root node of the state tree
+    """
     # Create root node with initial position
     root_node = StateTreeNode(
         id=generate_unique_id(),
@@ -77,6 +112,10 @@ def parse_pgn_to_state_tree(
         )
     )
     
+    if game is None:
+        # Empty PGN - just return root node with starting position
+        return root_node
+    
     # Build tree from parsed game
     board = chess.Board(initial_fen)
     _add_moves_to_node(root_node, game, board, is_mainline=True)
@@ -96,7 +135,7 @@ def _add_moves_to_node(
     Args:
         current_node: Current state tree node
         game_node: Current PGN game node from python-chess
-        board: Chess board at current position
+        board: Chess board at current position (moves are pushed onto it)
         is_mainline: Whether this is the main line
     """
     last_node = current_node
@@ -108,11 +147,8 @@ def _add_moves_to_node(
         # Store current color before making move
         move_color_bool = board.turn
         
-        # Get SAN before making the move
-        san = board.san(move)
-        
-        # Make the move
-        board.push(move)
+        # Get SAN and make the move in one step
+        san = board.san_and_push(move)
         
         # Get FEN after move
         fen_after = board.fen()
@@ -120,11 +156,8 @@ def _add_moves_to_node(
         # Convert move color
         move_color_str = chess_color_to_piece_color(move_color_bool)
         
-        # Create Move object
-        move_obj = Move(
-            san=san,
-            uci=move.uci()
-        )
+        # Create Move object (positional arguments, once per ply)
+        move_obj = Move(san, move.uci())
         
         # Create new node
         new_node = StateTreeNode(
@@ -147,19 +180,26 @@ def _add_moves_to_node(
         last_node.children.append(new_node)
         
         # Process variations (non-mainline alternatives)
-        if move_node.variations:
-            for variation in list(move_node.variations)[1:]:  # Skip first (mainline)
-                # Create a copy of board state before the move
-                board_copy = board.copy()
-                board_copy.pop()  # Remove the mainline move
-                
+        if len(move_node.variations) > 1:
+            # Step back to the position before the move on the same board
+            # instead of copying it for every variation
+            board.pop()  # Remove the mainline move
+            stack_size = len(board.move_stack)
+            
+            for variation in islice(move_node.variations, 1, None):  # Skip first (mainline)
                 # Recursively process variation
                 _add_moves_to_node(
                     last_node,  # Variations branch from parent
                     variation,
-                    board_copy,
+                    board,
                     is_mainline=False
                 )
+                
+                # Undo the variation's moves
+                while len(board.move_stack) > stack_size:
+                    board.pop()
+            
+            board.push(move)
         
         # Move to next node
         last_node = new_node
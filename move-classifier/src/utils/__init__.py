@@ -14,6 +14,7 @@ from .danger_levels import (
     has_danger_levels
 )
 from .piece_trapped import is_piece_trapped
+from .json_utils import json_loads
 
 __all__ = [
     "set_fen_turn",
@@ -27,4 +28,5 @@ __all__ = [
     "move_leaves_greater_threat",
     "has_danger_levels",
     "is_piece_trapped",
+    "json_loads",
 ]
\ No newline at end of file
@@ -6,26 +6,40 @@ Functions to detect pieces attacking a target square, including:
 - Transitive attackers (pieces behind other pieces in batteries)
 """
 
-from dataclasses import dataclass
-from typing import Optional
+from typing import NamedTuple, Optional
 import chess
 
 from ..models.chess_types import BoardPiece, RawMove, to_raw_move, to_board_piece
-from .chess_utils import set_fen_turn, get_capture_square, flip_piece_color
+from .chess_utils import flip_piece_color
 
 
-@dataclass
-class TransitiveAttacker:
-    """Represents a piece in an attacking battery."""
+DIRECT_ATTACKS_CACHE_SIZE = 100_000
+"""Maximum number of direct attacker results kept before the cache is cleared."""
+
+# Direct attacking moves by position and attacked square. Battery unrolling,
+# piece safety and danger levels ask about the same positions many times
+_direct_attacks_cache: dict[tuple, list[RawMove]] = {}
+
+
+class TransitiveAttacker(NamedTuple):
+    """
+    Represents a piece in an attacking battery.
+    
+    A NamedTuple rather than a dataclass: one is created for every piece
+    in the battery frontier and discarded once it is expanded.
+    """
     
-    direct_fen: str
-    """FEN where this piece is a direct attacker."""
+    direct_board: chess.Board
+    """Board where this piece is a direct attacker (not modified)."""
     
     square: chess.Square
     """Square where the attacking piece is located."""
     
     piece_type: chess.PieceType
     """Type of the attacking piece."""
+    
+    direct_attackers_mask: chess.Bitboard
+    """Squares of all direct attackers on that board."""
 
 
 def _direct_attacking_moves(
@@ -42,41 +56,102 @@ def _direct_attacking_moves(
     Returns:
         List of moves that attack the piece
     """
-    # Set turn to attacker's side (opposite of piece color)
-    attacker_fen = set_fen_turn(board.fen(), flip_piece_color(piece.color))
-    attacker_board = chess.Board(attacker_fen)
+    # Everything but the side to move, which is set to the attacker anyway
+    cache_key = (
+        board.pawns, board.knights, board.bishops, board.rooks,
+        board.queens, board.kings,
+        board.occupied_co[chess.WHITE], board.occupied_co[chess.BLACK],
+        board.castling_rights, board.ep_square,
+        piece.square, piece.color
+    )
+    
+    cached_moves = _direct_attacks_cache.get(cache_key)
+    if cached_moves is not None:
+        # Callers extend the returned list, so hand out a copy
+        return list(cached_moves)
     
-    # Get all legal moves that capture on the piece's square
-    attacking_moves: list[RawMove] = []
-    for move in attacker_board.legal_moves:
-        if get_capture_square(move) == piece.square:
-            attacking_moves.append(to_raw_move(move, attacker_board))
+    attacking_moves = _find_direct_attacking_moves(board, piece)
+    
+    if len(_direct_attacks_cache) >= DIRECT_ATTACKS_CACHE_SIZE:
+        _direct_attacks_cache.clear()
+    _direct_attacks_cache[cache_key] = attacking_moves
+    
+    return list(attacking_moves)
+
+
+def _find_direct_attacking_moves(
+    board: chess.Board,
+    piece: BoardPiece
+) -> list[RawMove]:
+    """
+    Find all direct attacking moves on a piece, without the cache.
+    
+    Args:
+        board: Current board position
+        piece: Piece being attacked
+        
+    Returns:
+        List of moves that attack the piece
+    """
+    attacker_color = flip_piece_color(piece.color)
+    
+    # Set turn to attacker's side (opposite of piece color) on a copy,
+    # without a round trip through FEN
+    attacker_board = board.copy(stack=False)
+    attacker_board.turn = attacker_color
+    
+    # Get all legal moves that capture on the piece's square. Generating
+    # only moves onto that square keeps the order of the full legal move
+    # list without walking it
+    attacking_moves: list[RawMove] = [
+        to_raw_move(move, attacker_board)
+        for move in attacker_board.generate_legal_moves(
+            chess.BB_ALL,
+            chess.BB_SQUARES[piece.square]
+        )
+    ]
     
     # Special case: King attacks are not always in legal moves if they would
-    # put the king in check. Check if king is an attacker using board.attackers()
-    attackers_squares = attacker_board.attackers(
-        flip_piece_color(piece.color),
-        piece.square
+    # put the king in check. Check if king is an attacker using the king
+    # attack table, without building the attackers of every piece type
+    king_attackers = (
+        chess.BB_KING_ATTACKS[piece.square]
+        & attacker_board.kings
+        & attacker_board.occupied_co[attacker_color]
     )
     
-    for attacker_square in attackers_squares:
-        attacker_piece = attacker_board.piece_at(attacker_square)
-        if attacker_piece and attacker_piece.piece_type == chess.KING:
-            # Check if king attack is already in the list
-            if not any(
-                move.piece == chess.KING and move.from_square == attacker_square
-                for move in attacking_moves
-            ):
-                attacking_moves.append(RawMove(
-                    piece=chess.KING,
-                    color=flip_piece_color(piece.color),
-                    from_square=attacker_square,
-                    to_square=piece.square
-                ))
+    for attacker_square in chess.scan_forward(king_attackers):
+        # Check if king attack is already in the list
+        if not any(
+            move.piece == chess.KING and move.from_square == attacker_square
+            for move in attacking_moves
+        ):
+            attacking_moves.append(RawMove(
+                piece=chess.KING,
+                color=attacker_color,
+                from_square=attacker_square,
+                to_square=piece.square
+            ))
     
     return attacking_moves
 
 
+def _from_squares_mask(moves: list[RawMove]) -> chess.Bitboard:
+    """
+    Get the bitboard of the squares moves start from.
+    
+    Args:
+        moves: Moves to collect
+        
+    Returns:
+        Bitboard with the from square of every move set
+    """
+    mask = chess.BB_EMPTY
+    for move in moves:
+        mask |= chess.BB_SQUARES[move.from_square]
+    return mask
+
+
 def get_attacking_moves(
     board: chess.Board,
     piece: BoardPiece,
@@ -101,51 +176,48 @@ def get_attacking_moves(
     if not transitive:
         return attacking_moves
     
-    # Keep a record of each transitive attacker and the FEN on
-    # which they are considered a direct attacker
+    # Keep a record of each transitive attacker and the board on
+    # which they are considered a direct attacker, along with the
+    # squares of the direct attackers there. Only the front piece of a
+    # battery is removed and the target square is fixed, so attacking
+    # moves are told apart by their from square alone
+    direct_attackers_mask = _from_squares_mask(attacking_moves)
     frontier: list[TransitiveAttacker] = [
         TransitiveAttacker(
-            direct_fen=board.fen(),
+            direct_board=board,
             square=move.from_square,
-            piece_type=move.piece
+            piece_type=move.piece,
+            direct_attackers_mask=direct_attackers_mask
         )
         for move in attacking_moves
     ]
     
     while frontier:
-        transitive_attacker = frontier.pop()
+        direct_board, square, piece_type, old_attackers_mask = frontier.pop()
         
         # A king cannot be at the front of a battery
-        if transitive_attacker.piece_type == chess.KING:
+        if piece_type == chess.KING:
             continue
         
-        # Create board from the FEN where this piece was a direct attacker
-        transitive_board = chess.Board(transitive_attacker.direct_fen)
-        
-        # Get old attacking moves before removing the piece
-        old_attacking_moves = _direct_attacking_moves(transitive_board, piece)
+        # Copy the board where this piece was a direct attacker
+        transitive_board = direct_board.copy(stack=False)
         
         # Remove the piece at the front of the battery
-        transitive_board.remove_piece_at(transitive_attacker.square)
+        transitive_board.remove_piece_at(square)
         
         # Find revealed attackers
         new_attacking_moves = _direct_attacking_moves(transitive_board, piece)
+        new_attackers_mask = _from_squares_mask(new_attacking_moves)
         
-        # Find moves that are in new but not in old (excluding the removed piece)
-        old_attacking_moves_filtered = [
-            move for move in old_attacking_moves
-            if move.from_square != transitive_attacker.square
-        ]
+        # Moves in new but not in old. The removed piece cannot move on the
+        # new board, so it needs no special handling
+        revealed_mask = new_attackers_mask & ~old_attackers_mask
+        if not revealed_mask:
+            continue
         
-        # XOR: moves in new but not in old
         revealed_attacking_moves = [
             move for move in new_attacking_moves
-            if not any(
-                old.from_square == move.from_square and
-                old.to_square == move.to_square and
-                old.piece == move.piece
-                for old in old_attacking_moves_filtered
-            )
+            if revealed_mask & chess.BB_SQUARES[move.from_square]
         ]
         
         # Record revealed attackers in final list
@@ -154,9 +226,10 @@ def get_attacking_moves(
         # Queue revealed attackers for further recursion
         frontier.extend([
             TransitiveAttacker(
-                direct_fen=transitive_board.fen(),
+                direct_board=transitive_board,
                 square=move.from_square,
-                piece_type=move.piece
+                piece_type=move.piece,
+                direct_attackers_mask=new_attackers_mask
             )
             for move in revealed_attacking_moves
         ])
@@ -42,7 +42,26 @@ def is_black_to_move(position: str) -> bool:
     Returns:
         True if black to move, False if white to move
     """
-    return position.split()[1] == 'b'
+    # The active color is the single character after the piece placement
+    return position[position.index(' ') + 1] == 'b'
+
+
+def get_position_key(fen: str) -> str:
+    """
+    Get a FEN without its fullmove number.
+    
+    Positions reached by transposition, or at a different move number,
+    share the same key. The halfmove clock is kept, since engine scores
+    depend on it through the fifty-move rule.
+    
+    Args:
+        fen: FEN string
+        
+    Returns:
+        Piece placement, active color, castling rights, en passant square
+        and halfmove clock
+    """
+    return " ".join(fen.split(None, 5)[:5])
 
 
 def set_fen_turn(fen: str, color: chess.Color) -> str:
@@ -56,9 +75,9 @@ def set_fen_turn(fen: str, color: chess.Color) -> str:
     Returns:
         Modified FEN string with updated turn
     """
-    parts = fen.split(' ')
-    parts[1] = 'w' if color == chess.WHITE else 'b'
-    return ' '.join(parts)
+    # The active color is the single character after the piece placement
+    turn_index = fen.index(' ') + 1
+    return fen[:turn_index] + ('w' if color else 'b') + fen[turn_index + 1:]
 
 
 def get_capture_square(move: chess.Move) -> Optional[chess.Square]:
@@ -89,4 +108,5 @@ def flip_piece_color(color: chess.Color) -> chess.Color:
     Returns:
         Opposite color
     """
-    return chess.BLACK if color == chess.WHITE else chess.WHITE
+    # Colors are booleans (WHITE is True)
+    return not color
@@ -6,7 +6,7 @@ Functions to determine if unsafe pieces are protected by counter-threats
 counter-threat, it's protected by "danger levels".
 """
 
-from typing import List, Literal, Optional
+from typing import Dict, List, Literal, Optional, Set, Tuple
 import chess
 
 from ..models.chess_types import BoardPiece, RawMove, to_raw_move
@@ -15,6 +15,15 @@ from ..utils.piece_safety import get_unsafe_pieces
 from ..utils.attackers import get_attacking_moves
 
 
+# Identifies an attacking move by its from square, to square and piece
+_AttackKey = Tuple[chess.Square, chess.Square, chess.PieceType]
+
+# Piece values indexed by piece type (1 to 6), for lookups in tight loops
+_PIECE_VALUES_BY_TYPE = (0,) + tuple(
+    PIECE_VALUES[piece_type] for piece_type in chess.PIECE_TYPES
+)
+
+
 def _relative_unsafe_piece_attacks(
     action_board: chess.Board,
     threatened_piece: BoardPiece,
@@ -37,6 +46,7 @@ def _relative_unsafe_piece_attacks(
     unsafe_pieces = get_unsafe_pieces(action_board, color, played_move)
     
     relative_attacks: List[RawMove] = []
+    threatened_value = _PIECE_VALUES_BY_TYPE[threatened_piece.type]
     
     for unsafe_piece in unsafe_pieces:
         # Skip the threatened piece itself
@@ -44,7 +54,7 @@ def _relative_unsafe_piece_attacks(
             continue
         
         # Only consider pieces >= value of threatened piece
-        if PIECE_VALUES[unsafe_piece.type] < PIECE_VALUES[threatened_piece.type]:
+        if _PIECE_VALUES_BY_TYPE[unsafe_piece.type] < threatened_value:
             continue
         
         # Get all attacking moves from this unsafe piece
@@ -54,17 +64,48 @@ def _relative_unsafe_piece_attacks(
     return relative_attacks
 
 
-def _parse_san_move_for_checkmate(san: str) -> bool:
+def _attack_keys(attacks: List[RawMove]) -> Set[_AttackKey]:
+    """
+    Get the (from square, to square, piece) keys of attacking moves.
+    
+    Args:
+        attacks: Attacking moves
+        
+    Returns:
+        Set of keys identifying the attacks
+    """
+    return {
+        (attack.from_square, attack.to_square, attack.piece)
+        for attack in attacks
+    }
+
+
+def _has_checkmating_move(board: chess.Board) -> bool:
     """
-    Check if a SAN move string indicates checkmate.
+    Check if the side to move can deliver checkmate in one move.
+    
+    Same as looking for a legal move whose SAN ends in '#', without
+    building SAN for every legal move.
     
     Args:
-        san: Move in SAN notation
+        board: Current board position (restored before returning)
         
     Returns:
-        True if move is checkmate
+        True if any legal move is checkmate
     """
-    return san.endswith('#')
+    for move in list(board.legal_moves):
+        # Only checking moves can mate
+        if not board.gives_check(move):
+            continue
+        
+        board.push(move)
+        is_checkmate = board.is_checkmate()
+        board.pop()
+        
+        if is_checkmate:
+            return True
+    
+    return False
 
 
 def move_creates_greater_threat(
@@ -87,15 +128,44 @@ def move_creates_greater_threat(
     Returns:
         True if acting creates a greater counter-threat
     """
-    action_board = chess.Board(board.fen())
+    action_board = board.copy(stack=False)
     
     # Get unsafe pieces BEFORE the acting move
-    previous_relative_attacks = _relative_unsafe_piece_attacks(
+    previous_attack_keys = _attack_keys(_relative_unsafe_piece_attacks(
         action_board,
         threatened_piece,
         acting_move.color
+    ))
+    
+    return _creates_greater_threat(
+        action_board,
+        threatened_piece,
+        acting_move,
+        previous_attack_keys
     )
+
+
+def _creates_greater_threat(
+    action_board: chess.Board,
+    threatened_piece: BoardPiece,
+    acting_move: RawMove,
+    previous_attack_keys: Set[_AttackKey]
+) -> bool:
+    """
+    Check if an acting move creates a greater counter-threat, playing it
+    on the given board and taking it back afterwards.
     
+    Args:
+        action_board: Position before the acting move (restored before
+                      returning)
+        threatened_piece: Piece under threat
+        acting_move: Move acting on the threat
+        previous_attack_keys: Keys of the relative unsafe piece attacks of
+                              the acting color before the move
+        
+    Returns:
+        True if acting creates a greater counter-threat
+    """
     # Try to make the acting move
     try:
         move = chess.Move(
@@ -107,44 +177,32 @@ def move_creates_greater_threat(
     except (ValueError, AssertionError):
         return False
     
-    # Get unsafe pieces AFTER the acting move
-    relative_attacks = _relative_unsafe_piece_attacks(
-        action_board,
-        threatened_piece,
-        acting_move.color,
-        move
-    )
-    
-    # Find NEW attacks that didn't exist before
-    new_relative_attacks = []
-    for attack in relative_attacks:
-        # Check if this attack is new (not in previous attacks)
-        is_new = True
-        for prev_attack in previous_relative_attacks:
-            if (
-                attack.from_square == prev_attack.from_square
-                and attack.to_square == prev_attack.to_square
-                and attack.piece == prev_attack.piece
-            ):
-                is_new = False
-                break
+    try:
+        # Get unsafe pieces AFTER the acting move
+        relative_attacks = _relative_unsafe_piece_attacks(
+            action_board,
+            threatened_piece,
+            acting_move.color,
+            move
+        )
         
-        if is_new:
-            new_relative_attacks.append(attack)
-    
-    if len(new_relative_attacks) > 0:
-        return True
-    
-    # Lower value piece sacrifice that if taken leads to mate
-    low_value_checkmate_pin = (
-        PIECE_VALUES[threatened_piece.type] < PIECE_VALUES[chess.QUEEN]
-        and any(
-            _parse_san_move_for_checkmate(action_board.san(move))
-            for move in action_board.legal_moves
+        # Find NEW attacks that didn't exist before
+        if any(
+            (attack.from_square, attack.to_square, attack.piece)
+            not in previous_attack_keys
+            for attack in relative_attacks
+        ):
+            return True
+        
+        # Lower value piece sacrifice that if taken leads to mate
+        low_value_checkmate_pin = (
+            PIECE_VALUES[threatened_piece.type] < PIECE_VALUES[chess.QUEEN]
+            and _has_checkmating_move(action_board)
         )
-    )
-    
-    return low_value_checkmate_pin
+        
+        return low_value_checkmate_pin
+    finally:
+        action_board.pop()
 
 
 def move_leaves_greater_threat(
@@ -166,8 +224,31 @@ def move_leaves_greater_threat(
     Returns:
         True if move leaves a greater counter-threat
     """
-    action_board = chess.Board(board.fen())
+    return _leaves_greater_threat(
+        board.copy(stack=False),
+        threatened_piece,
+        acting_move
+    )
+
+
+def _leaves_greater_threat(
+    action_board: chess.Board,
+    threatened_piece: BoardPiece,
+    acting_move: RawMove
+) -> bool:
+    """
+    Check if an acting move leaves a greater threat, playing it on the
+    given board and taking it back afterwards.
     
+    Args:
+        action_board: Position before the acting move (restored before
+                      returning)
+        threatened_piece: Piece under threat
+        acting_move: Move acting on the threat
+        
+    Returns:
+        True if move leaves a greater counter-threat
+    """
     # Try to make the acting move
     try:
         move = chess.Move(
@@ -179,26 +260,26 @@ def move_leaves_greater_threat(
     except (ValueError, AssertionError):
         return False
     
-    # Get unsafe pieces AFTER the acting move
-    relative_attacks = _relative_unsafe_piece_attacks(
-        action_board,
-        threatened_piece,
-        acting_move.color
-    )
-    
-    if len(relative_attacks) > 0:
-        return True
-    
-    # Lower value piece sacrifice that if taken leads to mate
-    low_value_checkmate_pin = (
-        PIECE_VALUES[threatened_piece.type] < PIECE_VALUES[chess.QUEEN]
-        and any(
-            _parse_san_move_for_checkmate(action_board.san(move))
-            for move in action_board.legal_moves
+    try:
+        # Get unsafe pieces AFTER the acting move
+        relative_attacks = _relative_unsafe_piece_attacks(
+            action_board,
+            threatened_piece,
+            acting_move.color
         )
-    )
-    
-    return low_value_checkmate_pin
+        
+        if len(relative_attacks) > 0:
+            return True
+        
+        # Lower value piece sacrifice that if taken leads to mate
+        low_value_checkmate_pin = (
+            PIECE_VALUES[threatened_piece.type] < PIECE_VALUES[chess.QUEEN]
+            and _has_checkmating_move(action_board)
+        )
+        
+        return low_value_checkmate_pin
+    finally:
+        action_board.pop()
 
 
 def has_danger_levels(
@@ -225,14 +306,31 @@ def has_danger_levels(
     Returns:
         True if ALL acting moves create/leave greater threats
     """
+    # One copy for all acting moves, each played on it and taken back
+    action_board = board.copy(stack=False)
+    
     if equality_strategy == "creates":
-        return all(
-            move_creates_greater_threat(board, threatened_piece, move)
-            for move in acting_moves
-        )
+        # The position before each acting move is the same, so the attacks
+        # that already exist are found and keyed once per acting color
+        previous_keys_by_color: Dict[chess.Color, Set[_AttackKey]] = {}
+        
+        for move in acting_moves:
+            if move.color not in previous_keys_by_color:
+                previous_keys_by_color[move.color] = _attack_keys(
+                    _relative_unsafe_piece_attacks(board, threatened_piece, move.color)
+                )
+            
+            if not _creates_greater_threat(
+                action_board,
+                threatened_piece,
+                move,
+                previous_keys_by_color[move.color]
+            ):
+                return False
+        
+        return True
     else:  # "leaves"
         return all(
-            move_leaves_greater_threat(board, threatened_piece, move)
+            _leaves_greater_threat(action_board, threatened_piece, move)
             for move in acting_moves
         )
-
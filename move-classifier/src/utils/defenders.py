@@ -8,7 +8,7 @@ from typing import Optional
 import chess
 
 from ..models.chess_types import BoardPiece, RawMove, to_board_piece
-from .chess_utils import set_fen_turn, flip_piece_color
+from .chess_utils import flip_piece_color
 from .attackers import get_attacking_moves
 
 
@@ -34,8 +34,15 @@ def get_defending_moves(
     Returns:
         List of defending moves
     """
-    defender_board = chess.Board(board.fen())
-    attacking_moves = get_attacking_moves(defender_board, piece, transitive=False)
+    # The board is only read and copied below, never modified
+    defender_board = board
+    
+    # Without any piece attacking the square there can be no capture, so
+    # skip looking for legal attacking moves
+    if board.attackers_mask(flip_piece_color(piece.color), piece.square):
+        attacking_moves = get_attacking_moves(defender_board, piece, transitive=False)
+    else:
+        attacking_moves = []
     
     # Where there are attackers, simulate taking the piece with each attacker
     # and record the minima of recaptures
@@ -43,11 +50,8 @@ def get_defending_moves(
     
     for attacking_move in attacking_moves:
         # Create board with turn set to the attacker's color
-        capture_fen = set_fen_turn(
-            defender_board.fen(),
-            flip_piece_color(piece.color)
-        )
-        capture_board = chess.Board(capture_fen)
+        capture_board = defender_board.copy(stack=False)
+        capture_board.turn = flip_piece_color(piece.color)
         
         # Try to make the attacking move
         try:
@@ -88,7 +92,7 @@ def get_defending_moves(
     )
     
     # Create a new board with the flipped piece
-    flipped_board = chess.Board(defender_board.fen())
+    flipped_board = defender_board.copy(stack=False)
     flipped_board.remove_piece_at(piece.square)
     flipped_board.set_piece_at(
         piece.square,
@@ -9,18 +9,28 @@ Helper functions for evaluation calculations:
 """
 
 import math
-from typing import Optional
+from typing import Optional, List, Sequence
 
 from ..models.state_tree import Evaluation
 from ..models.enums import PieceColor
 from ..constants import (
     CENTIPAWN_GRADIENT,
+    EXPECTED_POINTS_LUT,
+    EXPECTED_POINTS_LUT_BOUND,
     ACCURACY_MULTIPLIER,
     ACCURACY_EXPONENT,
     ACCURACY_OFFSET
 )
 
 
+# Reading PieceColor.WHITE goes through the Enum metaclass, about 170 ns
+# slower than a global on CPython 3.11 and a fifth of a whole
+# get_subjective_evaluation call. Point loss reads them three times per
+# move, so the members are bound once here.
+_WHITE = PieceColor.WHITE
+_BLACK = PieceColor.BLACK
+
+
 def get_expected_points(
     evaluation: Evaluation,
     move_colour: Optional[PieceColor] = None,
@@ -49,13 +59,22 @@ def get_expected_points(
             # Mate already delivered - winner determined by move colour
             # Return 1.0 if WHITE won, 0.0 if BLACK won
             if move_colour is not None:
-                return 1.0 if move_colour == PieceColor.WHITE else 0.0
+                return 1.0 if move_colour == _WHITE else 0.0
             # If no move colour specified, return 0.5 (unknown)
             return 0.5
         
         # Forced mate = certain outcome (positive = White winning, negative = Black winning)
         return 1.0 if evaluation.value > 0 else 0.0
     else:
+        # Integer evaluations at the default gradient come from the lookup table
+        if gradient == CENTIPAWN_GRADIENT:
+            centipawns = int(evaluation.value)
+            if (
+                centipawns == evaluation.value
+                and -EXPECTED_POINTS_LUT_BOUND <= centipawns <= EXPECTED_POINTS_LUT_BOUND
+            ):
+                return EXPECTED_POINTS_LUT[centipawns + EXPECTED_POINTS_LUT_BOUND]
+        
         # Sigmoid function for centipawn evaluation
         return 1.0 / (1.0 + math.exp(-gradient * evaluation.value))
 
@@ -74,7 +93,7 @@ def get_subjective_evaluation(
     Returns:
         Evaluation from player's perspective
     """
-    multiplier = 1 if player_color == PieceColor.WHITE else -1
+    multiplier = 1 if player_color == _WHITE else -1
     
     return Evaluation(
         type=evaluation.type,
@@ -113,7 +132,7 @@ def get_expected_points_loss(
     )
     
     # Calculate loss with perspective adjustment
-    multiplier = 1 if move_color == PieceColor.WHITE else -1
+    multiplier = 1 if move_color == _WHITE else -1
     loss = (prev_ep - curr_ep) * multiplier
     
     return max(0.0, loss)
@@ -143,10 +162,74 @@ def get_move_accuracy(
         move_color
     )
     
+    return get_accuracy_from_point_loss(point_loss)
+
+
+def get_accuracy_from_point_loss(point_loss: float) -> float:
+    """
+    Convert an already computed point loss to a 0-100 accuracy score.
+    
+    Formula: Accuracy = 103.16 × e^(-4 × pointLoss) - 3.17
+    
+    Args:
+        point_loss: Expected points lost by the move
+        
+    Returns:
+        Accuracy score (0-100)
+    """
     # Exponential decay formula
-    accuracy = ACCURACY_MULTIPLIER * math.exp(ACCURACY_EXPONENT * point_loss) + ACCURACY_OFFSET
+    return ACCURACY_MULTIPLIER * math.exp(ACCURACY_EXPONENT * point_loss) + ACCURACY_OFFSET
+
+
+def get_move_accuracies(
+    previous_evaluations: Sequence[Evaluation],
+    current_evaluations: Sequence[Evaluation],
+    move_colors: Sequence[PieceColor]
+) -> List[float]:
+    """
+    Calculate move accuracies for a whole sequence of moves in one pass.
+    
+    Equivalent to calling get_move_accuracy for each move, without the
+    per-call overhead.
+    
+    Args:
+        previous_evaluations: Evaluations before each move
+        current_evaluations: Evaluations after each move
+        move_colors: Color that played each move
+        
+    Returns:
+        Accuracy score (0-100) for each move, in order
+    """
+    exp = math.exp
+    expected_points = get_expected_points
+    accuracies: List[float] = []
+    
+    for previous_evaluation, current_evaluation, move_color in zip(
+        previous_evaluations,
+        current_evaluations,
+        move_colors
+    ):
+        # Same loss as get_expected_points_loss, with the perspective
+        # multiplier folded into the order of the subtraction
+        if move_color == _WHITE:
+            point_loss = (
+                expected_points(previous_evaluation, _BLACK)
+                - expected_points(current_evaluation, _WHITE)
+            )
+        else:
+            point_loss = (
+                expected_points(current_evaluation, _BLACK)
+                - expected_points(previous_evaluation, _WHITE)
+            )
+        
+        if point_loss < 0.0:
+            point_loss = 0.0
+        
+        accuracies.append(
+            ACCURACY_MULTIPLIER * exp(ACCURACY_EXPONENT * point_loss) + ACCURACY_OFFSET
+        )
     
-    return accuracy
+    return accuracies
 
 
 def flip_piece_color(color: PieceColor) -> PieceColor:
@@ -159,4 +242,4 @@ def flip_piece_color(color: PieceColor) -> PieceColor:
     Returns:
         Opposite color
     """
-    return PieceColor.BLACK if color == PieceColor.WHITE else PieceColor.WHITE
+    return _BLACK if color == _WHITE else _WHITE
@@ -0,0 +1,19 @@
+"""
+JSON Utility Functions
+
+JSON decoding shared by the opening book and the cloud evaluation cache.
+"""
+
+import json
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:  # Optional speedup, fall back to the standard library
+    json_loads = json.loads
+"""
+Decode JSON from bytes or str, with orjson when it is installed.
+
+Decoding errors are json.JSONDecodeError in both cases, as
+orjson.JSONDecodeError subclasses it.
+"""
@@ -47,12 +47,11 @@ def is_piece_safe(
     defenders = [to_board_piece(move) for move in defenders_moves]
     
     # Special case: Favorable, decimal sacrifices (rook for 2 pieces etc.) are safe
-    if played_move:
-        captured_piece = board.piece_at(played_move.to_square) if played_move else None
+    if played_move and piece.type == chess.ROOK:
+        captured_piece_type = board.piece_type_at(played_move.to_square)
         if (
-            captured_piece
-            and piece.type == chess.ROOK
-            and PIECE_VALUES[captured_piece.piece_type] == PIECE_VALUES[chess.KNIGHT]
+            captured_piece_type
+            and PIECE_VALUES[captured_piece_type] == PIECE_VALUES[chess.KNIGHT]
             and len(attackers) == 1
             and len(defenders) > 0
             and PIECE_VALUES[attackers[0].type] == PIECE_VALUES[chess.KNIGHT]
@@ -119,9 +118,9 @@ def get_unsafe_pieces(
     # Determine captured piece value
     captured_piece_value = 0
     if played_move:
-        captured_piece = board.piece_at(played_move.to_square)
-        if captured_piece:
-            captured_piece_value = PIECE_VALUES[captured_piece.piece_type]
+        captured_piece_type = board.piece_type_at(played_move.to_square)
+        if captured_piece_type:
+            captured_piece_value = PIECE_VALUES[captured_piece_type]
     
     # Get all pieces of the specified color
     all_pieces = get_board_pieces(board)
@@ -10,7 +10,6 @@ from typing import Optional
 from ..models.chess_types import BoardPiece
 from ..utils.piece_safety import is_piece_safe
 from ..utils.danger_levels import move_creates_greater_threat
-from ..utils.chess_utils import set_fen_turn
 
 
 def is_piece_trapped(
@@ -34,8 +33,8 @@ def is_piece_trapped(
         True if piece is trapped
     """
     # Calibrate board to piece's turn
-    calibrated_fen = set_fen_turn(board.fen(), piece.color)
-    calibrated_board = chess.Board(calibrated_fen)
+    calibrated_board = board.copy(stack=False)
+    calibrated_board.turn = piece.color
     
     # Check if piece is currently safe
     standing_piece_safety = is_piece_safe(calibrated_board, piece)
@@ -51,12 +50,11 @@ def is_piece_trapped(
     
     for move in piece_moves:
         # Can't capture king (shouldn't happen but safety check)
-        captured_piece = calibrated_board.piece_at(move.to_square)
-        if captured_piece and captured_piece.piece_type == chess.KING:
+        if calibrated_board.piece_type_at(move.to_square) == chess.KING:
             all_moves_unsafe = False
             break
         
-        escape_board = chess.Board(calibrated_board.fen())
+        escape_board = calibrated_board.copy(stack=False)
         
         # If danger levels enabled, check if move creates greater threat
         if danger_levels:
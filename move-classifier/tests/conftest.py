@@ -7,7 +7,22 @@ Shared fixtures and configuration for all tests.
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add src directory to Python path
 src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
 
+
+@pytest.fixture(autouse=True)
+def reset_analysis_caches():
+    """Start each test without cached cloud evaluations or open on-disk caches."""
+    from src.engine.cloud_evaluator import clear_cloud_cache
+    from src.engine.disk_cache import close_caches
+    
+    clear_cloud_cache()
+    
+    yield
+    
+    clear_cloud_cache()
+    close_caches()
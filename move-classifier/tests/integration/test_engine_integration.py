@@ -5,6 +5,7 @@ Tests for cloud and local engine integration.
 """
 
 import pytest
+import chess
 
 from src.engine.cloud_evaluator import get_cloud_evaluation, _convert_uci_moves_to_san
 from src.engine.uci_engine import UCIEngine
@@ -189,6 +190,131 @@ class TestUCIEngine:
         except FileNotFoundError:
             pytest.skip("Stockfish not installed")
     
+    @pytest.mark.integration
+    @pytest.mark.engine
+    def test_uci_engine_position_from_moves(self):
+        """Test setting a position from a root FEN and the moves played."""
+        try:
+            engine = UCIEngine()
+            engine.set_position(STARTING_FEN, ["e2e4", "e7e5", "g1f3"])
+            
+            assert engine.position == "rnbqkbnr/pppp1ppp/8/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R b KQkq - 1 2"
+            
+            lines = engine.evaluate(depth=8, multi_pv=1)
+            
+            assert len(lines) > 0
+            
+            # PV must start with a Black move in the resulting position
+            board = chess.Board(engine.position)
+            assert chess.Move.from_uci(lines[0].moves[0].uci) in board.legal_moves
+            
+            engine.new_game()
+            engine.set_position(STARTING_FEN)
+            
+            assert len(engine.evaluate(depth=8, multi_pv=1)) > 0
+            
+            engine.terminate()
+        
+        except FileNotFoundError:
+            pytest.skip("Stockfish not installed")
+    
+    @pytest.mark.integration
+    @pytest.mark.engine
+    def test_uci_engine_new_game_for_unrelated_positions(self):
+        """Test that only positions continuing the previous one share a game."""
+        try:
+            engine = UCIEngine()
+            engine.set_position(STARTING_FEN, ["e2e4"])
+            game = engine._game
+            
+            # Later in the same game, or one move on from the last position
+            engine.set_position(STARTING_FEN, ["e2e4", "e7e5", "g1f3"])
+            engine.set_position("r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 2 3")
+            assert engine._game is game
+            
+            # Unrelated position
+            engine.set_position("8/8/4k3/8/8/4K3/4P3/8 w - - 0 1")
+            assert engine._game is not game
+            
+            engine.terminate()
+        
+        except FileNotFoundError:
+            pytest.skip("Stockfish not installed")
+    
+    @pytest.mark.integration
+    @pytest.mark.engine
+    def test_uci_engine_reuses_deep_enough_results(self):
+        """Test that a repeated search is served from the analysis cache."""
+        try:
+            engine = UCIEngine()
+            engine.set_position(STARTING_FEN)
+            
+            lines = engine.evaluate(depth=8, multi_pv=2)
+            
+            # Same or shallower depth reuses the cached lines
+            assert engine.evaluate(depth=8, multi_pv=2)[0] is lines[0]
+            assert engine.evaluate(depth=6, multi_pv=2)[0] is lines[0]
+            
+            # Deeper search or different MultiPV runs the engine again
+            deeper_lines = engine.evaluate(depth=9, multi_pv=2)
+            assert deeper_lines[0] is not lines[0]
+            assert deeper_lines[0].depth >= 9
+            assert engine.evaluate(depth=8, multi_pv=1)[0] is not lines[0]
+            
+            engine.terminate()
+            
+        except FileNotFoundError:
+            pytest.skip("Stockfish not installed")
+    
+    @pytest.mark.integration
+    @pytest.mark.engine
+    def test_uci_engine_cache_ignores_fullmove_number(self):
+        """Test that a transposed position is served from the analysis cache."""
+        try:
+            engine = UCIEngine()
+            engine.set_position(STARTING_FEN, ["g1f3", "g8f6", "b1c3"])
+            
+            lines = engine.evaluate(depth=8, multi_pv=2)
+            
+            # Same position reached by another move order
+            engine.set_position(STARTING_FEN, ["b1c3", "g8f6", "g1f3"])
+            assert engine.evaluate(depth=8, multi_pv=2)[0] is lines[0]
+            
+            # Same position at a later move number
+            engine.set_position(engine.position.rsplit(" ", 1)[0] + " 12")
+            assert engine.evaluate(depth=8, multi_pv=2)[0] is lines[0]
+            
+            # A different halfmove clock is searched again
+            engine.set_position(engine.position.rsplit(" ", 2)[0] + " 40 30")
+            assert engine.evaluate(depth=8, multi_pv=2)[0] is not lines[0]
+            
+            engine.terminate()
+            
+        except FileNotFoundError:
+            pytest.skip("Stockfish not installed")
+    
+    @pytest.mark.integration
+    @pytest.mark.engine
+    def test_uci_engine_results_persist_on_disk(self, tmp_path):
+        """Test that another engine reuses stored results without searching."""
+        cache_path = str(tmp_path / "engine.sqlite")
+        
+        try:
+            engine = UCIEngine(cache_path=cache_path)
+            engine.set_position(STARTING_FEN, ["e2e4"])
+            lines = engine.evaluate(depth=8, multi_pv=2)
+            engine.terminate()
+            
+            # A fresh engine has an empty in-memory cache; with its process
+            # stopped, any result must come from disk
+            other_engine = UCIEngine(cache_path=cache_path)
+            other_engine.terminate()
+            other_engine.set_position(STARTING_FEN, ["e2e4"])
+            
+            assert other_engine.evaluate(depth=6, multi_pv=2) == lines
+        except FileNotFoundError:
+            pytest.skip("Stockfish not installed")
+    
     @pytest.mark.integration
     @pytest.mark.engine
     def test_uci_engine_handles_mate(self):
@@ -216,6 +342,59 @@ class TestUCIEngine:
             pytest.skip("Stockfish not installed")
 
 
+class TestEnginePool:
+    """Test concurrent analysis with a pool of local engines."""
+    
+    @pytest.mark.integration
+    @pytest.mark.engine
+    @pytest.mark.slow
+    def test_analyze_many_preserves_order(self):
+        """Results come back in the same order as the positions."""
+        from src.engine.engine_pool import EnginePool
+        from src.config import EngineConfig
+        
+        fens = [
+            STARTING_FEN,
+            "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1",
+            "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq e6 0 2",
+        ]
+        
+        try:
+            with EnginePool(EngineConfig(depth=6, multi_pv=1), size=2) as pool:
+                results = pool.analyze_many(fens)
+        except FileNotFoundError:
+            pytest.skip("Stockfish not installed")
+        
+        assert len(results) == len(fens)
+        
+        for fen, lines in zip(fens, results):
+            assert len(lines) > 0
+            
+            # First move of the PV must be legal in its own position
+            board = chess.Board(fen)
+            assert chess.Move.from_uci(lines[0].moves[0].uci) in board.legal_moves
+
+
+    @pytest.mark.integration
+    @pytest.mark.engine
+    def test_borrow_engine_reuses_idle_engine(self):
+        """A returned engine is handed out again instead of starting a new one."""
+        from src.engine.engine_pool import borrow_engine
+        
+        try:
+            with borrow_engine() as engine:
+                first_engine = engine
+        except FileNotFoundError:
+            pytest.skip("Stockfish not installed")
+        
+        with borrow_engine() as engine:
+            assert engine is first_engine
+            
+            # A second concurrent borrow needs its own engine
+            with borrow_engine() as other_engine:
+                assert other_engine is not engine
+
+
 class TestEngineAnalyzerIntegration:
     """Test engine analyzer coordination."""
     
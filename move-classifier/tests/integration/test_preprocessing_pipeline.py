@@ -7,15 +7,15 @@ Tests each stage of the 5-stage preprocessing pipeline with real data.
 import pytest
 import chess
 
-from src.preprocessing.parser import parse_pgn_game
+from src.preprocessing.parser import parse_pgn_game, iter_pgn_games
 from src.preprocessing.engine_analyzer import analyze_state_tree, get_top_engine_line
-from src.preprocessing.node_chain_builder import get_node_chain
+from src.preprocessing.node_chain_builder import get_node_chain, iter_node_chain, iter_mainline
 from src.preprocessing.node_extractor import (
     extract_previous_state_tree_node,
     extract_current_state_tree_node
 )
-from src.preprocessing.calculator import calculate_move_metrics
-from src.preprocessing import run_full_preprocessing_pipeline
+from src.preprocessing.calculator import calculate_move_metrics, apply_accuracies
+from src.preprocessing import run_full_preprocessing_pipeline, run_preprocessing_pipeline_batch
 from src.config import EngineConfig
 from src.constants import STARTING_FEN
 
@@ -152,6 +152,19 @@ class TestStage1Parser:
         # Second move node
         node2 = node1.children[0]
         assert node2.parent == node1
+    
+    def test_iter_games_from_stream(self):
+        """Test parsing every game of a multi-game PGN stream."""
+        import io
+        
+        stream = io.StringIO(
+            f"{SIMPLE_GAME} *\n\n{SCHOLARS_MATE} 1-0\n\n1. d4 *\n"
+        )
+        roots = list(iter_pgn_games(stream))
+        
+        assert len(roots) == 3
+        assert [len(get_node_chain(root)) for root in roots] == [5, 8, 2]
+        assert roots[2].children[0].state.move.san == "d4"
 
 
 class TestStage2EngineAnalysis:
@@ -214,6 +227,54 @@ class TestStage2EngineAnalysis:
         except FileNotFoundError:
             pytest.skip("Stockfish not installed")
     
+    def test_analyze_with_parallel_local_engines(self):
+        """Test local analysis split across several engines."""
+        root = parse_pgn_game(SIMPLE_GAME)
+        
+        config = EngineConfig(
+            depth=8,
+            multi_pv=2,
+            use_cloud_eval=False,
+            engine_workers=2
+        )
+        
+        try:
+            analyze_state_tree(root, config)
+            
+            # Every position is analyzed, and lines are attached to their own node
+            for node in get_node_chain(root):
+                assert len(node.state.engine_lines) > 0
+                
+                board = chess.Board(node.state.fen)
+                top_move = node.state.engine_lines[0].moves[0]
+                assert chess.Move.from_uci(top_move.uci) in board.legal_moves
+        except FileNotFoundError:
+            pytest.skip("Stockfish not installed")
+    
+    def test_repeated_position_with_new_halfmove_clock_is_analyzed_again(self):
+        """Test that a repetition at a higher halfmove clock gets its own lines."""
+        root = parse_pgn_game("1. Nf3 Nf6 2. Ng1 Ng8 3. Nf3")
+        
+        config = EngineConfig(
+            depth=8,
+            multi_pv=2,
+            use_cloud_eval=False,
+            engine_workers=2
+        )
+        
+        try:
+            analyze_state_tree(root, config)
+            
+            nodes = get_node_chain(root)
+            
+            # 3. Nf3 repeats the position after 1. Nf3, but engine scores
+            # depend on the halfmove clock
+            assert nodes[5].state.fen != nodes[1].state.fen
+            assert nodes[5].state.engine_lines
+            assert nodes[5].state.engine_lines[0] is not nodes[1].state.engine_lines[0]
+        except FileNotFoundError:
+            pytest.skip("Stockfish not installed")
+    
     def test_get_top_engine_line(self):
         """Test extraction of best engine line."""
         root = parse_pgn_game("1. e4")
@@ -288,6 +349,30 @@ class TestStage3NodeChain:
         
         assert len(nodes) == 1
         assert nodes[0] == root
+    
+    def test_iter_mainline_matches_chain(self):
+        """Test that the mainline generator yields the same nodes lazily."""
+        root = parse_pgn_game(WITH_VARIATIONS)
+        
+        mainline = iter_mainline(root)
+        assert next(mainline) is root
+        
+        remaining = list(mainline)
+        assert [node.state.move.san for node in remaining] == ["e4", "e5", "Nf3"]
+        assert all(
+            a is b for a, b in zip([root] + remaining, get_node_chain(root))
+        )
+    
+    def test_iter_node_chain_matches_chain(self):
+        """Test that the chain generator yields the same nodes with variations."""
+        root = parse_pgn_game(WITH_VARIATIONS)
+        
+        for expand_all_variations in (False, True):
+            chain = iter_node_chain(root, expand_all_variations)
+            assert next(chain) is root
+            
+            expected = get_node_chain(root, expand_all_variations)
+            assert [root] + list(chain) == expected
 
 
 class TestStage4NodeExtraction:
@@ -358,6 +443,41 @@ class TestStage4NodeExtraction:
         assert current.evaluation is not None
         assert current.subjective_evaluation is not None
         assert current.played_move is not None
+        
+        # An already parsed parent board gives the same result
+        parent_board = chess.Board(node.parent.state.fen)
+        shared = extract_current_state_tree_node(node, parent_board)
+        
+        assert shared == current
+        assert parent_board.fen() == node.parent.state.fen
+    
+    def test_extract_line_moves_from_uci_or_san(self):
+        """Test that line moves are read from UCI, falling back to SAN."""
+        root = parse_pgn_game(SIMPLE_GAME)
+        
+        from src.models.state_tree import EngineLine, Evaluation, Move
+        
+        node = get_node_chain(root)[1]  # After 1. e4
+        node.state.engine_lines = [
+            EngineLine(
+                evaluation=Evaluation(type="centipawn", value=30.0),
+                source="test",
+                depth=10,
+                index=index,
+                moves=[move]
+            )
+            for index, move in enumerate(
+                [Move(san="c5", uci="c7c5"), Move(san="e5", uci="")],
+                start=1
+            )
+        ]
+        
+        previous = extract_previous_state_tree_node(node)
+        
+        assert previous is not None
+        assert previous.top_move == chess.Move.from_uci("c7c5")
+        assert previous.second_top_move == chess.Move.from_uci("e7e5")
+        assert previous.played_move == chess.Move.from_uci("e2e4")
     
     def test_extract_fails_without_engine_lines(self):
         """Test that extraction returns None without engine analysis."""
@@ -435,6 +555,38 @@ class TestStage5Calculator:
         assert 0.0 <= point_loss <= 1.0
         assert 0.0 <= accuracy <= 100.0
     
+    def test_apply_accuracies_matches_extracted_nodes(self):
+        """Test the batch accuracy path against full node extraction."""
+        from src.models.state_tree import EngineLine, Evaluation, Move
+        
+        root = parse_pgn_game(SIMPLE_GAME)
+        nodes = get_node_chain(root)
+        
+        top_moves = [
+            ("Nf3", "g1f3"), ("Nf6", "g8f6"), ("d4", "d2d4"), ("Qe2", "d1e2"), ("a6", "a7a6")
+        ]
+        values = [30.0, 25.0, 40.0, 10.0, 35.0]
+        for value, node, (san, uci) in zip(values, nodes, top_moves):
+            node.state.engine_lines = [EngineLine(
+                evaluation=Evaluation(type="centipawn", value=value),
+                source="test",
+                depth=10,
+                index=1,
+                moves=[Move(san=san, uci=uci)]
+            )]
+        
+        apply_accuracies(nodes[1:])
+        
+        # Qe2 is illegal before 2... Nc6 (Black to move), so that move has no accuracy
+        assert nodes[4].state.accuracy is None
+        
+        for node in nodes[1:4]:
+            previous = extract_previous_state_tree_node(node.parent)
+            current = extract_current_state_tree_node(node)
+            _, accuracy = calculate_move_metrics(previous, current)
+            
+            assert node.state.accuracy == accuracy
+    
     def test_expected_points_calculation(self):
         """Test expected points conversion."""
         from src.utils.evaluation_utils import get_expected_points
@@ -587,6 +739,40 @@ class TestFullPipeline:
         except Exception as e:
             pytest.skip(f"Pipeline failed: {e}")
 
+    
+    @pytest.mark.slow
+    @pytest.mark.integration
+    def test_batch_pipeline_matches_single_game_pipeline(self):
+        """Test that games analyzed in worker processes match sequential analysis."""
+        config = EngineConfig(depth=8, multi_pv=2, use_cloud_eval=False)
+        
+        try:
+            roots = run_preprocessing_pipeline_batch(
+                [SIMPLE_GAME, SCHOLARS_MATE],
+                config=config,
+                max_workers=2
+            )
+            expected_root = run_full_preprocessing_pipeline(SCHOLARS_MATE, config=config)
+        except Exception as e:
+            pytest.skip(f"Pipeline failed (expected if no stockfish): {e}")
+        
+        assert len(roots) == 2
+        assert len(get_node_chain(roots[0])) == 5
+        
+        nodes = get_node_chain(roots[1])
+        expected_nodes = get_node_chain(expected_root)
+        
+        assert [node.state.fen for node in nodes] == [node.state.fen for node in expected_nodes]
+        
+        # Engine lines computed in the workers are attached to every position
+        assert [len(node.state.engine_lines) for node in nodes] == [
+            len(node.state.engine_lines) for node in expected_nodes
+        ]
+        
+        # Parent links are rebuilt in this process
+        for i in range(1, len(nodes)):
+            assert nodes[i].parent is nodes[i - 1]
+
 
 class TestErrorHandling:
     """Test error handling in pipeline."""
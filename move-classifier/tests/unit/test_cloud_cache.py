@@ -0,0 +1,220 @@
+"""
+Unit tests for the cloud evaluation cache
+"""
+
+import json
+
+import pytest
+import requests
+
+from src.engine import cloud_evaluator
+from src.engine.cloud_evaluator import get_cloud_evaluation
+from src.preprocessing.engine_analyzer import analyze_state_tree
+from src.preprocessing.node_chain_builder import get_node_chain
+from src.preprocessing.parser import parse_pgn_game
+from src.config import EngineConfig
+from src.constants import STARTING_FEN
+
+
+CACHED_RESPONSE = {
+    "fen": STARTING_FEN,
+    "knodes": 100,
+    "depth": 40,
+    "pvs": [
+        {"moves": "e2e4 e7e5 g1f3", "cp": 18},
+        {"moves": "d2d4 d7d5 c2c4", "cp": 17},
+        {"moves": "g1f3 d7d5 d2d4", "cp": 15},
+    ],
+}
+
+
+@pytest.fixture
+def cloud_cache(tmp_path):
+    """Path of an empty temporary cloud cache database."""
+    return str(tmp_path / "cloud.sqlite")
+
+
+class TestCloudCache:
+    """Test cached cloud evaluation lookups."""
+    
+    def test_cache_miss(self, cloud_cache):
+        """Unknown positions are not found in the cache."""
+        assert cloud_evaluator._read_cached_payload(cloud_cache, STARTING_FEN, 2) is None
+    
+    def test_cached_response_is_served(self, cloud_cache):
+        """A stored response is parsed without going to the network."""
+        cloud_evaluator._write_cached_payload(
+            cloud_cache, STARTING_FEN, 3, 40, json.dumps(CACHED_RESPONSE).encode()
+        )
+        
+        engine_lines = get_cloud_evaluation(
+            STARTING_FEN, multi_pv=3, cache_path=cloud_cache
+        )
+        
+        assert [line.index for line in engine_lines] == [1, 2, 3]
+        assert engine_lines[0].depth == 40
+        assert engine_lines[0].moves[0].san == "e4"
+        assert engine_lines[0].evaluation.value == 18
+    
+    def test_response_with_more_lines_is_trimmed(self, cloud_cache):
+        """A response with extra lines also serves smaller requests."""
+        cloud_evaluator._write_cached_payload(
+            cloud_cache, STARTING_FEN, 3, 40, json.dumps(CACHED_RESPONSE).encode()
+        )
+        
+        engine_lines = get_cloud_evaluation(
+            STARTING_FEN, multi_pv=2, cache_path=cloud_cache
+        )
+        
+        assert len(engine_lines) == 2
+        assert cloud_evaluator._read_cached_payload(cloud_cache, STARTING_FEN, 4) is None
+    
+    def test_cache_is_only_used_with_a_path(self, cloud_cache, monkeypatch):
+        """Without a cache path, stored responses are not read."""
+        def refuse(url, timeout):
+            raise requests.ConnectionError("offline")
+        
+        monkeypatch.setattr(cloud_evaluator._SESSION, "get", refuse)
+        
+        cloud_evaluator._write_cached_payload(
+            cloud_cache, STARTING_FEN, 2, 40, json.dumps(CACHED_RESPONSE).encode()
+        )
+        
+        with pytest.raises(Exception, match="Cloud evaluation failed"):
+            get_cloud_evaluation(STARTING_FEN, multi_pv=2)
+    
+    def test_lines_are_kept_in_memory(self, monkeypatch):
+        """A position is requested once, whatever the timeout of later requests."""
+        requested = []
+        
+        def respond(url, timeout):
+            requested.append(url)
+            response = requests.Response()
+            response.status_code = 200
+            response._content = json.dumps(CACHED_RESPONSE).encode()
+            return response
+        
+        monkeypatch.setattr(cloud_evaluator._SESSION, "get", respond)
+        
+        engine_lines = get_cloud_evaluation(STARTING_FEN, multi_pv=3, timeout=10)
+        engine_lines.clear()
+        
+        engine_lines = get_cloud_evaluation(STARTING_FEN, multi_pv=3, timeout=5)
+        
+        assert len(requested) == 1
+        assert [line.index for line in engine_lines] == [1, 2, 3]
+    
+    def test_long_retry_after_gives_up(self, monkeypatch):
+        """A rate limit asking for a long wait fails without sleeping."""
+        requested = []
+        slept = []
+        
+        def rate_limited(url, timeout):
+            requested.append(url)
+            response = requests.Response()
+            response.status_code = 429
+            response.headers["Retry-After"] = "3600"
+            return response
+        
+        monkeypatch.setattr(cloud_evaluator._SESSION, "get", rate_limited)
+        monkeypatch.setattr(cloud_evaluator.time, "sleep", slept.append)
+        
+        with pytest.raises(Exception, match="Cloud evaluation failed"):
+            get_cloud_evaluation(STARTING_FEN, multi_pv=2)
+        
+        assert len(requested) == 1
+        assert slept == []
+    
+    def test_short_retry_after_is_honoured(self, monkeypatch):
+        """A rate limit asking for a short wait is retried after that wait."""
+        responses = [429, 200]
+        slept = []
+        
+        def rate_limited_once(url, timeout):
+            response = requests.Response()
+            response.status_code = responses.pop(0)
+            response.headers["Retry-After"] = "2"
+            response._content = json.dumps(CACHED_RESPONSE).encode()
+            return response
+        
+        monkeypatch.setattr(cloud_evaluator._SESSION, "get", rate_limited_once)
+        monkeypatch.setattr(cloud_evaluator.time, "sleep", slept.append)
+        
+        engine_lines = get_cloud_evaluation(STARTING_FEN, multi_pv=3)
+        
+        assert slept == [2.0]
+        assert engine_lines[0].moves[0].san == "e4"
+    
+    def test_batch_preserves_order(self, cloud_cache):
+        """Batch results come back in the same order as the positions."""
+        after_e4 = "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1"
+        after_e4_response = {
+            "fen": after_e4,
+            "depth": 35,
+            "pvs": [{"moves": "c7c5 g1f3", "cp": 25}, {"moves": "e7e5 g1f3", "cp": 30}],
+        }
+        
+        cloud_evaluator._write_cached_payload(
+            cloud_cache, STARTING_FEN, 2, 40, json.dumps(CACHED_RESPONSE).encode()
+        )
+        cloud_evaluator._write_cached_payload(
+            cloud_cache, after_e4, 2, 35, json.dumps(after_e4_response).encode()
+        )
+        
+        results = cloud_evaluator.get_cloud_evaluations_batch(
+            [after_e4, STARTING_FEN, after_e4],
+            cache_path=cloud_cache
+        )
+        
+        assert [lines[0].moves[0].san for lines in results] == ["c5", "e4", "c5"]
+        assert cloud_evaluator.get_cloud_evaluations_batch([]) == []
+    
+    def test_batch_stops_when_unreachable(self, cloud_cache, monkeypatch):
+        """An unreachable API is only asked once per batch."""
+        requested = []
+        
+        def refuse(url, timeout):
+            requested.append(url)
+            raise requests.ConnectionError("offline")
+        
+        monkeypatch.setattr(cloud_evaluator._SESSION, "get", refuse)
+        
+        after_e4 = "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1"
+        results = cloud_evaluator.get_cloud_evaluations_batch(
+            [STARTING_FEN, after_e4],
+            cache_path=cloud_cache
+        )
+        
+        assert results == [None, None]
+        assert len(requested) == 1
+    
+    def test_state_tree_analysis_uses_cached_responses(self, cloud_cache):
+        """Cloud lines for every position are attached without a local engine."""
+        after_e4 = "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1"
+        after_e4_response = {
+            "fen": after_e4,
+            "depth": 35,
+            "pvs": [{"moves": "c7c5 g1f3", "cp": 25}, {"moves": "e7e5 g1f3", "cp": 30}],
+        }
+        
+        cloud_evaluator._write_cached_payload(
+            cloud_cache, STARTING_FEN, 2, 40, json.dumps(CACHED_RESPONSE).encode()
+        )
+        cloud_evaluator._write_cached_payload(
+            cloud_cache, after_e4, 2, 35, json.dumps(after_e4_response).encode()
+        )
+        
+        root = parse_pgn_game("1. e4")
+        analyze_state_tree(root, EngineConfig(
+            multi_pv=2,
+            use_cloud_eval=True,
+            cloud_cache_path=cloud_cache
+        ))
+        
+        nodes = get_node_chain(root)
+        assert [node.state.engine_lines[0].moves[0].san for node in nodes] == ["e4", "c5"]
+        assert all(
+            line.source == "lichess-cloud"
+            for node in nodes
+            for line in node.state.engine_lines
+        )
@@ -0,0 +1,198 @@
+"""
+Unit tests for the local engine wrapper, run on a stub engine
+"""
+
+import chess
+import chess.engine
+import pytest
+
+from src.engine.uci_engine import UCIEngine
+from src.constants import STARTING_FEN
+
+
+class StubAnalysis:
+    """Finished analysis with one scored line per MultiPV index."""
+    
+    def __init__(self, board, limit, multipv):
+        moves = list(board.legal_moves)
+        self.multipv = [
+            {
+                "score": chess.engine.PovScore(chess.engine.Cp(20 - index), chess.WHITE),
+                "depth": limit.depth,
+                "multipv": index + 1,
+                "pv": [moves[index]],
+            }
+            for index in range(multipv)
+        ]
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        return None
+    
+    def __iter__(self):
+        return iter(self.multipv)
+    
+    def wait(self):
+        return None
+
+
+class StubEngine:
+    """Stands in for chess.engine.SimpleEngine, counting searches."""
+    
+    id = {"name": "Stub 1"}
+    
+    def __init__(self):
+        self.searched_depths = []
+    
+    def analysis(self, board, limit, multipv=1, game=None):
+        self.searched_depths.append(limit.depth)
+        return StubAnalysis(board, limit, multipv)
+    
+    def configure(self, options):
+        return None
+    
+    def quit(self):
+        return None
+
+
+@pytest.fixture
+def stub_engine(monkeypatch):
+    """Start UCIEngine instances on stub engines instead of a binary."""
+    monkeypatch.setattr(
+        chess.engine.SimpleEngine,
+        "popen_uci",
+        lambda engine_path: StubEngine()
+    )
+    
+    def start(cache_path=None):
+        engine = UCIEngine(engine_path="stub", cache_path=cache_path)
+        engine.set_position(STARTING_FEN, ["e2e4"])
+        return engine
+    
+    return start
+
+
+class TestEngineCache:
+    """Test the on-disk cache of local engine results."""
+    
+    def test_results_are_read_back_by_another_engine(self, stub_engine, tmp_path):
+        """A fresh engine on the same cache serves stored lines without searching."""
+        cache_path = str(tmp_path / "engine.sqlite")
+        
+        lines = stub_engine(cache_path).evaluate(depth=8, multi_pv=2)
+        
+        other_engine = stub_engine(cache_path)
+        
+        assert other_engine.evaluate(depth=8, multi_pv=2) == lines
+        assert other_engine.engine.searched_depths == []
+    
+    def test_deeper_request_searches_and_upgrades_stored_lines(
+        self, stub_engine, tmp_path
+    ):
+        """Stored lines that are too shallow are searched again and replaced."""
+        cache_path = str(tmp_path / "engine.sqlite")
+        
+        stub_engine(cache_path).evaluate(depth=8, multi_pv=2)
+        
+        deeper_engine = stub_engine(cache_path)
+        deeper_engine.evaluate(depth=12, multi_pv=2)
+        assert deeper_engine.engine.searched_depths == [12]
+        
+        # Shallower requests are served from the deeper stored lines
+        other_engine = stub_engine(cache_path)
+        lines = other_engine.evaluate(depth=10, multi_pv=2)
+        assert other_engine.engine.searched_depths == []
+        assert [line.depth for line in lines] == [12, 12]
+    
+    def test_other_multi_pv_is_not_served(self, stub_engine, tmp_path):
+        """Lines are stored per MultiPV."""
+        cache_path = str(tmp_path / "engine.sqlite")
+        
+        stub_engine(cache_path).evaluate(depth=8, multi_pv=2)
+        
+        other_engine = stub_engine(cache_path)
+        assert len(other_engine.evaluate(depth=8, multi_pv=3)) == 3
+        assert other_engine.engine.searched_depths == [8]
+    
+    def test_no_cache_path_keeps_results_in_memory(self, stub_engine, tmp_path, monkeypatch):
+        """Without a cache path nothing is written to disk."""
+        monkeypatch.chdir(tmp_path)
+        
+        engine = stub_engine()
+        engine.evaluate(depth=8, multi_pv=2)
+        engine.evaluate(depth=8, multi_pv=2)
+        assert engine.engine.searched_depths == [8]
+        
+        other_engine = stub_engine()
+        other_engine.evaluate(depth=8, multi_pv=2)
+        assert other_engine.engine.searched_depths == [8]
+        assert list(tmp_path.iterdir()) == []
+    
+    def test_halfmove_clock_is_part_of_the_key(self, stub_engine):
+        """Positions differing only in the halfmove clock are searched separately."""
+        engine = stub_engine()
+        
+        engine.set_position("8/8/4k3/8/8/3K4/4R3/8 w - - 2 40")
+        engine.evaluate(depth=8, multi_pv=1)
+        
+        # Same position and clock at another move number is a cache hit
+        engine.set_position("8/8/4k3/8/8/3K4/4R3/8 w - - 2 75")
+        engine.evaluate(depth=8, multi_pv=1)
+        assert engine.engine.searched_depths == [8]
+        
+        engine.set_position("8/8/4k3/8/8/3K4/4R3/8 w - - 95 75")
+        engine.evaluate(depth=8, multi_pv=1)
+        assert engine.engine.searched_depths == [8, 8]
+
+
+class TestSetPosition:
+    """Test positions set from a root FEN and the moves played since."""
+    
+    def test_new_moves_are_played_on_the_current_board(self, stub_engine, monkeypatch):
+        """Continuing the game only parses the moves added since the last call."""
+        engine = stub_engine()
+        game = engine._game
+        
+        parsed = []
+        push_uci = chess.Board.push_uci
+        monkeypatch.setattr(
+            chess.Board,
+            "push_uci",
+            lambda board, uci: parsed.append(uci) or push_uci(board, uci)
+        )
+        
+        engine.set_position(STARTING_FEN, ["e2e4", "e7e5", "g1f3"])
+        
+        assert parsed == ["e7e5", "g1f3"]
+        assert engine._game is game
+        
+        expected = chess.Board()
+        for uci in ["e2e4", "e7e5", "g1f3"]:
+            expected.push_uci(uci)
+        assert engine.position == expected.fen()
+    
+    def test_other_moves_start_a_new_game(self, stub_engine):
+        """Moves that do not extend the previous ones are replayed from the root."""
+        engine = stub_engine()
+        game = engine._game
+        
+        engine.set_position(STARTING_FEN, ["d2d4"])
+        
+        assert engine._game is not game
+        assert engine.position == "rnbqkbnr/pppppppp/8/8/3P4/8/PPP1PPPP/RNBQKBNR b KQkq - 0 1"
+    
+    def test_illegal_move_keeps_the_previous_position(self, stub_engine):
+        """An illegal new move raises and leaves the previous position set."""
+        engine = stub_engine()
+        position = engine.position
+        
+        with pytest.raises(ValueError):
+            engine.set_position(STARTING_FEN, ["e2e4", "e7e5", "e1e8"])
+        
+        assert engine.position == position
+        assert len(engine.board.move_stack) == 1
+        
+        engine.set_position(STARTING_FEN, ["e2e4", "e7e5"])
+        assert engine.board.fen() == engine.position
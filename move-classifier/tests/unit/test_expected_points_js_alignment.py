@@ -5,7 +5,12 @@ Verifies that the Python implementation matches the JavaScript exactly.
 """
 
 import pytest
-from src.utils.evaluation_utils import get_expected_points, get_expected_points_loss
+from src.utils.evaluation_utils import (
+    get_expected_points,
+    get_expected_points_loss,
+    get_move_accuracy,
+    get_move_accuracies
+)
 from src.models.state_tree import Evaluation
 from src.models.enums import PieceColor
 
@@ -200,6 +205,41 @@ def test_javascript_alignment_point_loss_formula():
     assert abs(python_loss_black - js_loss_black) < 0.0001
 
 
+def test_expected_points_lookup_table_matches_formula():
+    """Table lookups must be identical to the sigmoid they replace."""
+    import math
+    
+    for value in (-2500.0, -2000.0, -731.0, -1.0, 0.0, 1.0, 45.0, 2000.0, 2500.0, 12.5):
+        evaluation = Evaluation(type="centipawn", value=value)
+        expected = 1.0 / (1.0 + math.exp(-0.0035 * value))
+        assert get_expected_points(evaluation) == expected
+
+
+def test_move_accuracies_match_scalar_accuracy():
+    """Batched accuracies must match per-move accuracy exactly."""
+    previous = [
+        Evaluation(type="centipawn", value=50.0),
+        Evaluation(type="centipawn", value=-120.0),
+        Evaluation(type="mate", value=3),
+        Evaluation(type="centipawn", value=300.0),
+    ]
+    current = [
+        Evaluation(type="centipawn", value=45.0),
+        Evaluation(type="centipawn", value=80.0),
+        Evaluation(type="centipawn", value=150.0),
+        Evaluation(type="mate", value=-2),
+    ]
+    colors = [PieceColor.WHITE, PieceColor.BLACK, PieceColor.WHITE, PieceColor.WHITE]
+    
+    expected = [
+        get_move_accuracy(prev, curr, color)
+        for prev, curr, color in zip(previous, current, colors)
+    ]
+    
+    assert get_move_accuracies(previous, current, colors) == expected
+    assert get_move_accuracies([], [], []) == []
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
 
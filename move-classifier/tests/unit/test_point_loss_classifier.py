@@ -0,0 +1,94 @@
+"""
+Unit tests for point loss classification
+"""
+
+import pytest
+
+from src.models.enums import Classification
+from src.classification.point_loss_classifier import (
+    _classify_mate_to_mate,
+    _classify_mate_to_cp,
+    _classify_cp_to_mate,
+    _classify_cp_to_cp
+)
+
+
+class TestMateToMate:
+    """Test mate to mate transitions."""
+    
+    def test_winning_mate_to_losing_mate(self):
+        """Throwing away a forced mate into a quick loss is a blunder."""
+        assert _classify_mate_to_mate(3, -2, -2, 1) == Classification.BLUNDER
+        assert _classify_mate_to_mate(3, -5, -5, 1) == Classification.MISTAKE
+    
+    def test_mate_loss_thresholds(self):
+        """Mate loss is measured from the mover's perspective."""
+        assert _classify_mate_to_mate(5, 4, 4, 1) == Classification.BEST
+        assert _classify_mate_to_mate(5, 6, 6, 1) == Classification.EXCELLENT
+        assert _classify_mate_to_mate(5, 10, 10, 1) == Classification.GOOD
+        assert _classify_mate_to_mate(5, 12, 12, 1) == Classification.INACCURACY
+        assert _classify_mate_to_mate(-5, -4, 4, -1) == Classification.BEST
+    
+    def test_losing_side_keeping_mate_distance(self):
+        """For the losing side, keeping the mate distance is best."""
+        assert _classify_mate_to_mate(-3, -3, -3, 1) == Classification.BEST
+
+
+class TestMateToCentipawn:
+    """Test mate to centipawn transitions."""
+    
+    @pytest.mark.parametrize("value, expected", [
+        (800, Classification.EXCELLENT),
+        (799, Classification.GOOD),
+        (400, Classification.GOOD),
+        (399, Classification.INACCURACY),
+        (200, Classification.INACCURACY),
+        (199, Classification.MISTAKE),
+        (0, Classification.MISTAKE),
+        (-1, Classification.BLUNDER),
+    ])
+    def test_thresholds(self, value, expected):
+        """Boundaries are inclusive on the lower bound."""
+        assert _classify_mate_to_cp(value) == expected
+
+
+class TestCentipawnToMate:
+    """Test centipawn to mate transitions."""
+    
+    @pytest.mark.parametrize("value, expected", [
+        (3, Classification.BEST),
+        (-1, Classification.BLUNDER),
+        (-2, Classification.BLUNDER),
+        (-3, Classification.MISTAKE),
+        (-5, Classification.MISTAKE),
+        (-6, Classification.INACCURACY),
+    ])
+    def test_thresholds(self, value, expected):
+        """Being mated sooner is worse."""
+        assert _classify_cp_to_mate(value) == expected
+
+
+class TestCentipawnToCentipawn:
+    """Test point loss thresholds."""
+    
+    @pytest.mark.parametrize("point_loss, expected", [
+        (0.0, Classification.BEST),
+        (0.0099, Classification.BEST),
+        (0.01, Classification.EXCELLENT),
+        (0.045, Classification.GOOD),
+        (0.08, Classification.INACCURACY),
+        (0.12, Classification.MISTAKE),
+        (0.22, Classification.BLUNDER),
+        (0.9, Classification.BLUNDER),
+    ])
+    def test_thresholds(self, point_loss, expected):
+        """Thresholds are exclusive upper bounds."""
+        assert _classify_cp_to_cp(point_loss) == expected
+    
+    def test_custom_thresholds(self):
+        """An alternative threshold set reuses the same classification."""
+        thresholds = (0.02, 0.05, 0.1, 0.15, 0.3)
+        
+        assert _classify_cp_to_cp(0.015, thresholds) == Classification.BEST
+        assert _classify_cp_to_cp(0.25, thresholds) == Classification.MISTAKE
+        assert _classify_cp_to_cp(0.3, thresholds) == Classification.BLUNDER
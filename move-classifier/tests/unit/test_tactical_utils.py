@@ -59,6 +59,29 @@ class TestAttackers:
         
         # With transitive, we should find the queen behind the rook
         assert len(attackers_with_transitive) >= len(attackers_no_transitive)
+    
+    def test_repeated_lookup_is_not_affected_by_earlier_results(self):
+        """Test that cached attackers are not changed through returned lists."""
+        board = chess.Board("3q4/8/3r4/8/3Q4/8/8/8 w - - 0 1")
+        queen = BoardPiece(
+            square=chess.D4,
+            type=chess.QUEEN,
+            color=chess.WHITE
+        )
+        
+        # Transitive lookups extend the direct attackers they start from
+        direct_attackers = get_attacking_moves(board, queen, transitive=False)
+        get_attacking_moves(board, queen, transitive=True)
+        direct_attackers.clear()
+        
+        assert [
+            move.from_square
+            for move in get_attacking_moves(board, queen, transitive=False)
+        ] == [chess.D6]
+        
+        # The side to move does not change the attackers
+        board.turn = chess.BLACK
+        assert len(get_attacking_moves(board, queen, transitive=False)) == 1
 
 
 class TestDefenders:
@@ -159,3 +182,15 @@ class TestBoardPieces:
         pawns = [p for p in pieces if p.type == chess.PAWN]
         assert len(pawns) == 16
 
+    
+    def test_get_board_pieces_matches_piece_map(self):
+        """Pieces are listed in square order with their type and color."""
+        board = chess.Board("r1bqk2r/pppp1ppp/2n2n2/2b1p3/2B1P3/5N2/PPPP1PPP/RNBQ1RK1 b kq - 5 4")
+        
+        pieces = [(p.square, p.type, p.color) for p in get_board_pieces(board)]
+        expected = [
+            (square, piece.piece_type, piece.color)
+            for square, piece in sorted(board.piece_map().items())
+        ]
+        
+        assert pieces == expected
@@ -31,6 +31,7 @@ Examples:
 
 import sys
 import argparse
+from collections import Counter
 from pathlib import Path
 
 # Add parent directory to path
@@ -471,62 +472,33 @@ Examples:
     # Classification summary
     if args.classify and classifier:
         print(f"\n🎯 CLASSIFICATION SUMMARY:")
-        classifications = {
-            "FORCED": 0, 
-            "THEORY": 0, 
-            "BEST": 0, 
-            "CRITICAL": 0,
-            "BRILLIANT": 0,
-            "EXCELLENT": 0,
-            "GOOD": 0,
-            "INACCURACY": 0,
-            "MISTAKE": 0,
-            "BLUNDER": 0,
-            "N/A": 0
-        }
+        classifications = Counter()
+        failed = 0
         missed_opportunities = 0
         
-        for i in range(1, len(nodes)):
+        for node in nodes[1:]:
             try:
-                result = classifier.classify(nodes[i])
+                result = classifier.classify(node)
                 
-                if result.classification == Classification.FORCED:
-                    classifications["FORCED"] += 1
-                elif result.classification == Classification.BOOK:
-                    classifications["THEORY"] += 1
-                elif result.classification == Classification.BEST:
-                    classifications["BEST"] += 1
-                elif result.classification == Classification.CRITICAL:
-                    classifications["CRITICAL"] += 1
-                elif result.classification == Classification.BRILLIANT:
-                    classifications["BRILLIANT"] += 1
-                elif result.classification == Classification.EXCELLENT:
-                    classifications["EXCELLENT"] += 1
-                elif result.classification == Classification.GOOD:
-                    classifications["GOOD"] += 1
-                elif result.classification == Classification.INACCURACY:
-                    classifications["INACCURACY"] += 1
-                elif result.classification == Classification.MISTAKE:
-                    classifications["MISTAKE"] += 1
-                elif result.classification == Classification.BLUNDER:
-                    classifications["BLUNDER"] += 1
+                # One hashed update per move instead of an if/elif chain
+                classifications[result.classification] += 1
                 
                 if result.is_missed_opportunity:
                     missed_opportunities += 1
             except:
-                classifications["N/A"] += 1
+                failed += 1
         
-        print(f"  FORCED (only 1 legal move):        {classifications['FORCED']}")
-        print(f"  THEORY (in opening book):           {classifications['THEORY']}")
-        print(f"  BEST (top move or checkmate):       {classifications['BEST']}")
-        print(f"  CRITICAL (prevents major loss):     {classifications['CRITICAL']}")
-        print(f"  BRILLIANT (sacrifice/risky):        {classifications['BRILLIANT']}")
-        print(f"  EXCELLENT (point loss < 0.045):     {classifications['EXCELLENT']}")
-        print(f"  GOOD (point loss < 0.08):           {classifications['GOOD']}")
-        print(f"  INACCURACY (point loss < 0.12):     {classifications['INACCURACY']}")
-        print(f"  MISTAKE (point loss < 0.22):        {classifications['MISTAKE']}")
-        print(f"  BLUNDER (point loss ≥ 0.22):        {classifications['BLUNDER']}")
-        print(f"  N/A (extraction failed):            {classifications['N/A']}")
+        print(f"  FORCED (only 1 legal move):        {classifications[Classification.FORCED]}")
+        print(f"  THEORY (in opening book):           {classifications[Classification.BOOK]}")
+        print(f"  BEST (top move or checkmate):       {classifications[Classification.BEST]}")
+        print(f"  CRITICAL (prevents major loss):     {classifications[Classification.CRITICAL]}")
+        print(f"  BRILLIANT (sacrifice/risky):        {classifications[Classification.BRILLIANT]}")
+        print(f"  EXCELLENT (point loss < 0.045):     {classifications[Classification.EXCELLENT]}")
+        print(f"  GOOD (point loss < 0.08):           {classifications[Classification.GOOD]}")
+        print(f"  INACCURACY (point loss < 0.12):     {classifications[Classification.INACCURACY]}")
+        print(f"  MISTAKE (point loss < 0.22):        {classifications[Classification.MISTAKE]}")
+        print(f"  BLUNDER (point loss ≥ 0.22):        {classifications[Classification.BLUNDER]}")
+        print(f"  N/A (extraction failed):            {failed}")
         print()
         print(f"  🚨 MISSED OPPORTUNITIES:              {missed_opportunities}")
     